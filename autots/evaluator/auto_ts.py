@@ -6,6 +6,7 @@ import gc
 import sys
 import time
 import traceback as tb
+from collections.abc import Mapping
 import numpy as np
 import pandas as pd
 
@@ -315,7 +316,10 @@ class AutoTS(object):
 
         # convert shortcuts of model lists to actual lists of models
         if model_list in list(model_lists.keys()):
+            # unfreeze, a mappingproxy would make the AutoTS object unpicklable
             self.model_list = model_lists[model_list]
+            if isinstance(self.model_list, Mapping):
+                self.model_list = dict(self.model_list)
         # prepare for a common Typo
         elif 'Prophet' in model_list:
             self.model_list = ["FBProphet" if x == "Prophet" else x for x in model_list]
@@ -2476,7 +2480,7 @@ class AutoTS(object):
         if isinstance(model_list, dict):
             model_list = list(model_list.keys())
         if include_ensemble:
-            mod_list = model_list + ['Ensemble']
+            mod_list = list(model_list) + ['Ensemble']
         else:
             mod_list = model_list
         present = template['Model'].unique().tolist()
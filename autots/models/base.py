@@ -8,11 +8,36 @@ import json
 import random
 import warnings
 import datetime
+from functools import lru_cache
 import numpy as np
 import pandas as pd
-from autots.tools.shaping import infer_frequency, clean_weights
+from pandas.tseries.frequencies import to_offset
+from autots.tools.shaping import infer_frequency
 from autots.evaluator.metrics import full_metric_evaluation
 
+# optional, used to fuse the constraint loops
+try:
+    from numba import njit, prange
+
+    numba_present = True
+except Exception:
+    numba_present = False
+# arrays smaller than this use the numpy paths, the first numba kernel called in a
+# process takes ~0.2s to load, while at 1e6 elements the kernels only save 5 to 25ms a call
+_numba_min_size = 1_000_000
+try:
+    import orjson
+
+    orjson_present = True
+except Exception:
+    orjson_present = False
+
+
+@lru_cache(maxsize=64)
+def _get_offset(frequency):
+    """Parse a frequency alias once, the parse is a sizable part of a short date_range."""
+    return to_offset(frequency)
+
 
 def create_forecast_index(frequency, forecast_length, train_last_date, last_date=None):
     if frequency == 'infer':
@@ -20,7 +45,7 @@ def create_forecast_index(frequency, forecast_length, train_last_date, last_date
             "create_forecast_index run without specific frequency, run basic_profile first or pass proper frequency to model init"
         )
     return pd.date_range(
-        freq=frequency,
+        freq=_get_offset(frequency),
         start=train_last_date if last_date is None else last_date,
         periods=forecast_length + 1,
     )[
@@ -113,6 +138,233 @@ class ModelObject(object):
         return datetime.datetime.now()
 
 
+def _threshold_values(threshold, columns, fill):
+    """Convert a scalar, array, or Series threshold to a float array broadcastable to (n, n_cols).
+
+    NaN thresholds are replaced with fill (+/- inf) so that column is left unconstrained.
+    """
+    if isinstance(threshold, pd.Series):
+        threshold = threshold.reindex(columns)
+    threshold = np.asarray(threshold, dtype=float)
+    if threshold.ndim:
+        threshold = threshold.reshape(1, -1)
+    return np.where(np.isnan(threshold), fill, threshold)
+
+
+def _float_values(df):
+    """Float ndarray of a DataFrame, a view where pandas allows it, keeping float32 if present."""
+    vals = df.to_numpy(copy=False)
+    if vals.dtype.kind != "f":
+        vals = vals.astype(float)
+    return vals
+
+
+def _writeable_values(df):
+    """Float ndarray of a DataFrame safe to modify in place."""
+    vals = _float_values(df)
+    if not vals.flags.writeable:
+        vals = vals.copy()
+    return vals
+
+
+def _constrained_frame(df, vals):
+    """Wrap constrained vals like df, int columns of df stay int where their values are still whole."""
+    int_pos = [
+        i for i, dtype in enumerate(df.dtypes) if getattr(dtype, "kind", "O") in "iu"
+    ]
+    columns = {}
+    with np.errstate(invalid="ignore"):
+        for i in int_pos:
+            cast = vals[:, i].astype(df.dtypes.iloc[i])
+            # as DataFrame.clip and where, only upcast when the int can't hold a value
+            if (cast == vals[:, i]).all():
+                columns[i] = cast
+    if not columns:
+        return pd.DataFrame(vals, index=df.index, columns=df.columns, copy=False)
+    result = pd.DataFrame(
+        {i: columns.get(i, vals[:, i]) for i in range(vals.shape[1])}, index=df.index
+    )
+    result.columns = df.columns
+    return result
+
+
+def _is_frame_view(df, vals):
+    """True if vals is a view of the DataFrame's own data, so edits to vals update df."""
+    return df.size > 0 and np.shares_memory(vals, df.iloc[:, 0].to_numpy())
+
+
+def _clip_values(vals, lo=-np.inf, hi=np.inf):
+    """Hard clip a 2d array in place."""
+    if np.all(np.isneginf(lo)):
+        # single sided, one broadcast pass instead of np.clip's two comparisons
+        np.minimum(vals, hi, out=vals)
+    elif np.all(np.isposinf(hi)):
+        np.maximum(vals, lo, out=vals)
+    else:
+        np.clip(vals, lo, hi, out=vals)
+    return vals
+
+
+if numba_present:
+
+    @njit(parallel=True, cache=True)
+    def _soft_clip_nb(arr, lo, hi, regularization):
+        """In place soft clip of a 2d array by per column 1d lo and hi thresholds."""
+        for i in prange(arr.shape[0]):
+            for j in range(arr.shape[1]):
+                v = arr[i, j]
+                if v < lo[j]:
+                    v = v + (lo[j] - v) * regularization
+                if v > hi[j]:
+                    v = v + (hi[j] - v) * regularization
+                arr[i, j] = v
+
+
+def _soft_clip_values(vals, lo=None, hi=None, regularization=0.5):
+    """In place, move values beyond lo/hi a fraction (regularization) of the way back to the threshold."""
+    if numba_present and vals.size >= _numba_min_size:
+        n_cols = vals.shape[1]
+        lo = np.broadcast_to(-np.inf if lo is None else lo, (1, n_cols))[0]
+        hi = np.broadcast_to(np.inf if hi is None else hi, (1, n_cols))[0]
+        _soft_clip_nb(vals, lo, hi, float(regularization))
+    else:
+        with np.errstate(invalid='ignore'):
+            if lo is not None:
+                np.copyto(vals, vals + (lo - vals) * regularization, where=vals < lo)
+            if hi is not None:
+                np.copyto(vals, vals + (hi - vals) * regularization, where=vals > hi)
+    return vals
+
+
+if numba_present:
+
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def _weighted_smape_rows_nb(F, A, w):
+        """Weighted SMAPE of each row, scaled as percent, in one pass over F and A.
+
+        NaN terms are skipped but the row is averaged over all non-NaN actuals, as with nansum.
+        """
+        out = np.empty(F.shape[0])
+        for i in prange(F.shape[0]):
+            total = 0.0
+            count = 0
+            for j in range(F.shape[1]):
+                a = A[i, j]
+                if np.isnan(a):
+                    continue
+                count += 1
+                f = F[i, j]
+                term = abs(f - a) / (abs(f) + abs(a)) * w[j]
+                if not np.isnan(term):
+                    total += term
+            out[i] = (total * 200) / count
+        return out
+
+
+def _shared_layout(*dfs):
+    """True if all are DataFrames with identical index and columns."""
+    first = dfs[0]
+    return all(
+        isinstance(df, pd.DataFrame)
+        and df.shape == first.shape
+        and df.columns.equals(first.columns)
+        and df.index.equals(first.index)
+        for df in dfs
+    )
+
+
+if numba_present:
+
+    @njit(parallel=True, cache=True)
+    def _col_stats_nb(arr):
+        """NaN skipping min, max, mean, and sample std of each column in one pass."""
+        n_cols = arr.shape[1]
+        col_min = np.full(n_cols, np.nan)
+        col_max = np.full(n_cols, np.nan)
+        col_mean = np.full(n_cols, np.nan)
+        col_std = np.full(n_cols, np.nan)
+        for j in prange(n_cols):
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            mn = np.inf
+            mx = -np.inf
+            for i in range(arr.shape[0]):
+                v = arr[i, j]
+                if not np.isnan(v):
+                    count += 1
+                    # Welford's update for a numerically stable variance
+                    delta = v - mean
+                    mean += delta / count
+                    m2 += delta * (v - mean)
+                    if v < mn:
+                        mn = v
+                    if v > mx:
+                        mx = v
+            if count > 0:
+                col_min[j] = mn
+                col_max[j] = mx
+                col_mean[j] = mean
+            if count > 1:
+                col_std[j] = np.sqrt(m2 / (count - 1))
+        return col_min, col_max, col_mean, col_std
+
+
+def _col_stats(arr):
+    """Return NaN skipping (min, max, mean, ddof=1 std) of each column of a 2d array."""
+    if numba_present and arr.size >= _numba_min_size:
+        return _col_stats_nb(arr)
+    return (
+        np.nanmin(arr, axis=0),
+        np.nanmax(arr, axis=0),
+        np.nanmean(arr, axis=0),
+        np.nanstd(arr, axis=0, ddof=1),
+    )
+
+
+def _compute_thresholds(
+    df_train, constraint_method, lower_constraint, upper_constraint
+):
+    """Find the (lower, upper) constraint thresholds, None where a side is unused."""
+    train_min = train_max = None
+    if constraint_method == "absolute":
+        return lower_constraint, upper_constraint
+    elif constraint_method not in ["stdev_min", "stdev", "quantile"]:
+        raise ValueError("constraint_method not recognized, adjust constraint")
+    arr = df_train.to_numpy(dtype=float, copy=False)
+    with warnings.catch_warnings():
+        # all NaN series give NaN thresholds, which are later treated as unconstrained
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        if constraint_method == "stdev_min":
+            col_min, col_max, _, train_std = _col_stats(arr)
+            if lower_constraint is not None:
+                train_min = col_min - (lower_constraint * train_std)
+            if upper_constraint is not None:
+                train_max = col_max + (upper_constraint * train_std)
+        elif constraint_method == "stdev":
+            _, _, train_mean, train_std = _col_stats(arr)
+            if lower_constraint is not None:
+                train_min = train_mean - (lower_constraint * train_std)
+            if upper_constraint is not None:
+                train_max = train_mean + (upper_constraint * train_std)
+        else:
+            # both quantiles from one sort of each series
+            qs = [q for q in (lower_constraint, upper_constraint) if q is not None]
+            # nanquantile falls back to a per column python loop, only pay for it with NaN present
+            quantile = np.nanquantile if np.isnan(arr).any() else np.quantile
+            train_q = list(quantile(arr, qs, axis=0))
+            if lower_constraint is not None:
+                train_min = train_q.pop(0)
+            if upper_constraint is not None:
+                train_max = train_q.pop(0)
+    # keep labels so thresholds still align to forecast columns by name
+    if train_min is not None:
+        train_min = pd.Series(train_min, index=df_train.columns)
+    if train_max is not None:
+        train_max = pd.Series(train_max, index=df_train.columns)
+    return train_min, train_max
+
+
 def apply_constraints(
     forecast,
     lower_forecast,
@@ -133,7 +385,7 @@ def apply_constraints(
         lower_forecast (pd.DataFrame): lower bound forecast df
             if bounds is False, upper and lower forecast dataframes are unused and can be empty
         upper_forecast (pd.DataFrame): upper bound forecast df
-        constraint_method (str): one of
+        constraint_method (str): one of, or None to skip constraints
             stdev_min - threshold is min and max of historic data +/- constraint * st dev of data
             stdev - threshold is the mean of historic data +/- constraint * st dev of data
             absolute - input is array of length series containing the threshold's final value for each
@@ -147,87 +399,91 @@ def apply_constraints(
 
     Returns:
         forecast, lower, upper (pd.DataFrame)
+            forecasts stored as a single float block are modified in place and returned as is
+            int columns keep their dtype unless a constrained value is no longer a whole number
     """
-    if constraint_method == "stdev_min":
-        train_std = df_train.std(axis=0)
-        if lower_constraint is not None:
-            train_min = df_train.min(axis=0) - (lower_constraint * train_std)
-        if upper_constraint is not None:
-            train_max = df_train.max(axis=0) + (upper_constraint * train_std)
-    elif constraint_method == "stdev":
-        train_std = df_train.std(axis=0)
-        train_mean = df_train.mean(axis=0)
-        if lower_constraint is not None:
-            train_min = train_mean - (lower_constraint * train_std)
-        if upper_constraint is not None:
-            train_max = train_mean + (upper_constraint * train_std)
-    elif constraint_method == "absolute":
-        train_min = lower_constraint
-        train_max = upper_constraint
-    elif constraint_method == "quantile":
-        if lower_constraint is not None:
-            train_min = df_train.quantile(lower_constraint, axis=0)
-        if upper_constraint is not None:
-            train_max = df_train.quantile(upper_constraint, axis=0)
-    else:
-        raise ValueError("constraint_method not recognized, adjust constraint")
+    # nothing would change, skip the threshold work entirely
+    if (
+        constraint_method is None
+        or constraint_regularization == 0
+        or (lower_constraint is None and upper_constraint is None)
+    ):
+        return forecast, lower_forecast, upper_forecast
+    # computed once per call and shared by forecast, lower and upper
+    train_min, train_max = _compute_thresholds(
+        df_train, constraint_method, lower_constraint, upper_constraint
+    )
 
-    if constraint_regularization == 1:
-        if lower_constraint is not None:
-            forecast = forecast.clip(lower=train_min, axis=1)
-        if upper_constraint is not None:
-            forecast = forecast.clip(upper=train_max, axis=1)
-        if bounds:
-            if lower_constraint is not None:
-                lower_forecast = lower_forecast.clip(lower=train_min, axis=1)
-                upper_forecast = upper_forecast.clip(lower=train_min, axis=1)
-            if upper_constraint is not None:
-                lower_forecast = lower_forecast.clip(upper=train_max, axis=1)
-                upper_forecast = upper_forecast.clip(upper=train_max, axis=1)
+    columns = forecast.columns
+    lo = (
+        None
+        if lower_constraint is None
+        else _threshold_values(train_min, columns, -np.inf)
+    )
+    hi = (
+        None
+        if upper_constraint is None
+        else _threshold_values(train_max, columns, np.inf)
+    )
+    # unused bounds become infinite so both sides are clipped in a single pass
+    lo_clip = -np.inf if lo is None else lo
+    hi_clip = np.inf if hi is None else hi
+    frames = (forecast, lower_forecast, upper_forecast) if bounds else (forecast,)
+    # raw values are pulled once per frame and constrained in place
+    values = [_writeable_values(df) for df in frames]
+    in_place = [_is_frame_view(df, vals) for df, vals in zip(frames, values)]
+    targets = values
+    if bounds and not all(in_place) and _shared_layout(*frames):
+        # copies are needed anyway, so make one contiguous (3, n, n_cols) array
+        # and constrain all three in one call
+        stack = np.empty((3,) + forecast.shape, dtype=np.result_type(*values))
+        for i, arr in enumerate(values):
+            stack[i] = arr
+        # C order, so this is a view and edits land in stack
+        targets = [stack.reshape(-1, stack.shape[2])]
+        values = list(stack)
+        in_place = [False] * 3
+    for vals in targets:
+        if constraint_regularization == 1:
+            _clip_values(vals, lo=lo_clip, hi=hi_clip)
+        else:
+            _soft_clip_values(vals, lo, hi, constraint_regularization)
+    # frames whose own data was edited are returned as is, others wrapped once
+    constrained = [
+        df if edited else _constrained_frame(df, vals)
+        for df, vals, edited in zip(frames, values, in_place)
+    ]
+    if bounds:
+        forecast, lower_forecast, upper_forecast = constrained
     else:
-        if lower_constraint is not None:
-            forecast.where(
-                forecast >= train_min,
-                forecast + (train_min - forecast) * constraint_regularization,
-                inplace=True,
-            )
-        if upper_constraint is not None:
-            forecast.where(
-                forecast <= train_max,
-                forecast + (train_max - forecast) * constraint_regularization,
-                inplace=True,
-            )
-        if bounds:
-            if lower_constraint is not None:
-                lower_forecast.where(
-                    lower_forecast >= train_min,
-                    lower_forecast
-                    + (train_min - lower_forecast) * constraint_regularization,
-                    inplace=True,
-                )
-                upper_forecast.where(
-                    upper_forecast >= train_min,
-                    upper_forecast
-                    + (train_min - upper_forecast) * constraint_regularization,
-                    inplace=True,
-                )
-            if upper_constraint is not None:
-                lower_forecast.where(
-                    lower_forecast <= train_max,
-                    lower_forecast
-                    + (train_max - lower_forecast) * constraint_regularization,
-                    inplace=True,
-                )
-
-                upper_forecast.where(
-                    upper_forecast <= train_max,
-                    upper_forecast
-                    + (train_max - upper_forecast) * constraint_regularization,
-                    inplace=True,
-                )
+        forecast = constrained[0]
     return forecast, lower_forecast, upper_forecast
 
 
+def _aligned_weights(series_weights, columns):
+    """Return series_weights as a float array ordered by columns, and the weight total.
+
+    Series missing from series_weights get 0 weight in the array.
+    """
+    # one hash join of the weight keys against the columns
+    weights = np.fromiter(
+        series_weights.values(), dtype=np.float64, count=len(series_weights)
+    )
+    pos = pd.Index(list(series_weights)).get_indexer(columns)
+    missing = pos < 0
+    if len(series_weights) != len(columns):
+        # make sure the series_weights are passed correctly to metrics
+        if missing.any():
+            raise KeyError(columns[missing][0])
+        w = weights[pos]
+        total = weights[np.unique(pos)].sum()
+    else:
+        # a series without a weight drops out of the weighted sum
+        w = np.where(missing, 0.0, weights[pos])
+        total = weights.sum()
+    return w, total
+
+
 def extract_single_series_from_horz(series, model_name, model_parameters):
     title_prelim = str(model_name)[0:80]
     if title_prelim == "Ensemble":
@@ -254,13 +510,28 @@ def extract_single_series_from_horz(series, model_name, model_parameters):
     return str(title_prelim)
 
 
+@lru_cache(maxsize=512)
+def _parse_params(param_string):
+    """Parse a json parameter string, memoized as ensembles repeat the same strings across series.
+
+    The returned dict is shared between calls and should not be modified.
+    """
+    if orjson_present:
+        try:
+            return orjson.loads(param_string)
+        except Exception:
+            # orjson is strict, json also accepts NaN and Infinity
+            pass
+    return json.loads(param_string)
+
+
 def extract_single_transformer(
     series, model_name, model_parameters, transformation_params
 ):
     if isinstance(transformation_params, str):
-        transformation_params = json.loads(transformation_params)
+        transformation_params = _parse_params(transformation_params)
     if isinstance(model_parameters, str):
-        model_parameters = json.loads(model_parameters)
+        model_parameters = _parse_params(model_parameters)
     if model_name == "Ensemble":
         # horizontal and mosaic ensembles
         if "series" in model_parameters.keys():
@@ -330,6 +601,20 @@ def calculate_peak_density(model, data, group_col='Model', y_col='TotalRuntimeSe
     return np.max(kde(model_data))
 
 
+def _average_peak_density(data, group_col='Model', y_col='TotalRuntimeSeconds'):
+    """Mean of calculate_peak_density across groups, splitting data by group in one pass."""
+    from scipy.stats import gaussian_kde
+
+    if data.empty:
+        return np.nan
+    values = data[y_col].to_numpy(dtype=float)
+    codes, _ = pd.factorize(data[group_col], sort=False)
+    order = np.argsort(codes, kind="stable")
+    groups = np.split(values[order], np.flatnonzero(np.diff(codes[order])) + 1)
+    # each KDE is evaluated on its own points
+    return np.mean([np.max(gaussian_kde(x)(x)) for x in groups])
+
+
 def plot_distributions(
     runtimes_data,
     group_col='Model',
@@ -345,12 +630,7 @@ def plot_distributions(
     multi_obs_models = runtimes_data.groupby(group_col).filter(lambda x: len(x) > 1)
 
     # Calculate the average peak density across all models with multiple observations
-    average_peak_density = np.mean(
-        [
-            calculate_peak_density(model, multi_obs_models, group_col, y_col)
-            for model in multi_obs_models[group_col].unique()
-        ]
-    )
+    average_peak_density = _average_peak_density(multi_obs_models, group_col, y_col)
 
     # Correcting the color palette to match the number of unique models
     unique_models = runtimes_data[group_col].nunique()
@@ -409,6 +689,26 @@ def plot_distributions(
     return fig
 
 
+def _per_timestamp_smape(F, A, w, full_mae_errors):
+    """One row DataFrame of weighted SMAPE per timestamp, w already divided by the mean weight."""
+    if numba_present and F.size >= _numba_min_size:
+        smape_cons = _weighted_smape_rows_nb(F, A, w)
+    else:
+        # abs(F - A) is already full_mae_errors, only the denominator is new work
+        nan_mask = np.isnan(A)
+        denom = np.abs(F)
+        denom += np.abs(A)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            wsmape = (full_mae_errors / denom) * w
+            # wsmape is a fresh array, zero NaN in place rather than the copy nansum makes
+            wsmape[np.isnan(wsmape)] = 0
+            smape_cons = (wsmape.sum(axis=1) * 200) / np.count_nonzero(
+                ~nan_mask, axis=1
+            )
+    # one row frame built directly, columns stay positional as before
+    return pd.DataFrame(smape_cons[np.newaxis, :], index=['weighted_smape'])
+
+
 class PredictionObject(object):
     """Generic class for holding forecast information.
 
@@ -422,7 +722,8 @@ class PredictionObject(object):
 
     Methods:
         long_form_results: return complete results in long form
-        total_runtime: return runtime for all model components in seconds
+        downcast: cast forecasts to float32 to reduce memory
+        total_runtime: return runtime for all model components as a datetime.timedelta
         plot
         evaluate
         apply_constraints
@@ -489,6 +790,27 @@ class PredictionObject(object):
         else:
             return False
 
+    def downcast(self, dtype=np.float32):
+        """Cast float64 forecasts to a smaller float dtype to halve their memory.
+
+        Opt-in, as float32 only carries about 7 significant digits.
+
+        Args:
+            dtype (np.dtype): float dtype to use
+
+        Returns:
+            self
+        """
+        for attr in ["forecast", "upper_forecast", "lower_forecast"]:
+            df = getattr(self, attr)
+            if isinstance(df, pd.DataFrame):
+                float_cols = df.select_dtypes(include=[np.float64]).columns
+                if len(float_cols) == df.shape[1]:
+                    setattr(self, attr, df.astype(dtype, copy=False))
+                elif len(float_cols) > 0:
+                    setattr(self, attr, df.astype({col: dtype for col in float_cols}))
+        return self
+
     def long_form_results(
         self,
         id_name="SeriesID",
@@ -509,33 +831,29 @@ class PredictionObject(object):
         Returns:
             pd.DataFrame
         """
-        upload = pd.melt(
-            self.forecast.reset_index(names='datetime'),
-            var_name="SeriesID",
-            value_name="Value",
-            id_vars="datetime",
-        ).set_index("datetime")
-        upload[interval_name] = "50%"
-        upload_upper = pd.melt(
-            self.upper_forecast.reset_index(names='datetime'),
-            var_name="SeriesID",
-            value_name="Value",
-            id_vars="datetime",
-        ).set_index("datetime")
-        upload_upper[
-            interval_name
-        ] = f"{round(100 - ((1- self.prediction_interval)/2) * 100, 0)}%"
-        upload_lower = pd.melt(
-            self.lower_forecast.reset_index(names='datetime'),
-            var_name="SeriesID",
-            value_name="Value",
-            id_vars="datetime",
-        ).set_index("datetime")
-        upload_lower[
-            interval_name
-        ] = f"{round(((1- self.prediction_interval)/2) * 100, 0)}%"
-
-        upload = pd.concat([upload, upload_upper, upload_lower], axis=0)
+        frames = [self.forecast, self.upper_forecast, self.lower_forecast]
+        intervals = [
+            "50%",
+            f"{round(100 - ((1- self.prediction_interval)/2) * 100, 0)}%",
+            f"{round(((1- self.prediction_interval)/2) * 100, 0)}%",
+        ]
+        # same column-major ordering as a melt of each, built in one pass
+        upload = pd.DataFrame(
+            {
+                "SeriesID": np.concatenate(
+                    [np.repeat(df.columns.to_numpy(), df.shape[0]) for df in frames]
+                ),
+                "Value": np.concatenate(
+                    [df.to_numpy().ravel(order='F') for df in frames]
+                ),
+                interval_name: np.repeat(intervals, [df.size for df in frames]),
+            },
+            index=self.forecast.index.take(
+                np.concatenate(
+                    [np.tile(np.arange(df.shape[0]), df.shape[1]) for df in frames]
+                )
+            ).rename("datetime"),
+        )
         if datetime_column is not None:
             upload = upload.reset_index(drop=False, names=datetime_column)
         if update_datetime_name is not None:
@@ -543,7 +861,7 @@ class PredictionObject(object):
         return upload
 
     def total_runtime(self):
-        """Combine runtimes."""
+        """Combine runtimes, as a datetime.timedelta (use .total_seconds() for a float)."""
         return self.fit_runtime + self.predict_runtime + self.transformation_runtime
 
     def extract_ensemble_runtimes(self):
@@ -585,7 +903,14 @@ class PredictionObject(object):
         remove_zeroes: bool = False,
         interpolate: str = None,
         start_date: str = None,
+        col_idx: int = None,
     ):
+        """Return a DataFrame of actuals, forecast and bounds for one series.
+
+        Args:
+            col_idx (int): optional integer position of series in forecast columns
+                skips label lookups when plotting many series, upper/lower must share the column order
+        """
         if series is None:
             series = random.choice(self.forecast.columns)
 
@@ -596,21 +921,29 @@ class PredictionObject(object):
                 if isinstance(h_params, str):
                     model_name = self.model_parameters['models'][h_params]['Model']
 
+        if col_idx is None:
+            up_forecast = self.upper_forecast[series]
+            low_forecast = self.lower_forecast[series]
+            forecast = self.forecast[series]
+        else:
+            up_forecast = self.upper_forecast.iloc[:, col_idx]
+            low_forecast = self.lower_forecast.iloc[:, col_idx]
+            forecast = self.forecast.iloc[:, col_idx]
         if df_wide is not None:
             plot_df = pd.DataFrame(
                 {
                     'actuals': df_wide[series],
-                    'up_forecast': self.upper_forecast[series],
-                    'low_forecast': self.lower_forecast[series],
-                    'forecast': self.forecast[series],
+                    'up_forecast': up_forecast,
+                    'low_forecast': low_forecast,
+                    'forecast': forecast,
                 }
             )
         else:
             plot_df = pd.DataFrame(
                 {
-                    'up_forecast': self.upper_forecast[series],
-                    'low_forecast': self.lower_forecast[series],
-                    'forecast': self.forecast[series],
+                    'up_forecast': up_forecast,
+                    'low_forecast': low_forecast,
+                    'forecast': forecast,
                 }
             )
         if remove_zeroes:
@@ -630,6 +963,18 @@ class PredictionObject(object):
             plot_df = plot_df[plot_df.index >= start_date]
         return plot_df
 
+    def _plot_start_date(self, df_wide=None, start_date="auto"):
+        """Resolve the 'auto' plot start date to a few forecast lengths of history."""
+        if start_date == "auto":
+            if df_wide is not None:
+                slx = -self.forecast_length * 3
+                if abs(slx) > df_wide.shape[0]:
+                    slx = 0
+                start_date = df_wide.index[slx]
+            else:
+                start_date = self.forecast.index[0]
+        return start_date
+
     def plot(
         self,
         df_wide=None,
@@ -645,6 +990,7 @@ class PredictionObject(object):
         vline=None,
         colors=None,
         include_bounds=True,
+        col_idx=None,
         **kwargs,
     ):
         """Generate an example plot of one series. Does not handle non-numeric forecasts.
@@ -662,16 +1008,10 @@ class PredictionObject(object):
             title (str): title
             title_substring (str): additional title details to pass to existing, moves series name to axis
             include_bounds (bool): if True, shows region of upper and lower forecasts
+            col_idx (int): optional integer position of series in forecast columns
             **kwargs passed to pd.DataFrame.plot()
         """
-        if start_date == "auto":
-            if df_wide is not None:
-                slx = -self.forecast_length * 3
-                if abs(slx) > df_wide.shape[0]:
-                    slx = 0
-                start_date = df_wide.index[slx]
-            else:
-                start_date = self.forecast.index[0]
+        start_date = self._plot_start_date(df_wide, start_date)
 
         if series is None:
             series = random.choice(self.forecast.columns)
@@ -681,6 +1021,7 @@ class PredictionObject(object):
             remove_zeroes=remove_zeroes,
             interpolate=interpolate,
             start_date=start_date,
+            col_idx=col_idx,
         )
         if self.forecast_length == 1 and 'actuals' in plot_df.columns:
             if plot_df.shape[0] > 3:
@@ -760,6 +1101,20 @@ class PredictionObject(object):
             ncol = 2
         fig, axes = plt.subplots(nrow, ncol, figsize=figsize, constrained_layout=True)
         fig.suptitle(title, fontsize='xx-large')
+        # shared across all axes, so resolved once rather than per series
+        start_date = self._plot_start_date(df_wide, start_date)
+        if df_wide is not None and start_date is not None and interpolate is None:
+            df_wide = df_wide[df_wide.index >= pd.to_datetime(start_date)]
+        fcol_idx = {col: i for i, col in enumerate(self.forecast.columns)}
+        series_titles = {
+            col: f"{col} with model "
+            + extract_single_series_from_horz(
+                col,
+                model_name=self.model_name,
+                model_parameters=self.model_parameters,
+            )[0:80]
+            for col in cols[: nrow * ncol]
+        }
         count = 0
         for r in range(nrow):
             for c in range(ncol):
@@ -779,6 +1134,8 @@ class PredictionObject(object):
                         start_date=start_date,
                         colors=colors,
                         include_bounds=include_bounds,
+                        col_idx=fcol_idx.get(col),
+                        title=series_titles[col],
                         ax=ax,
                     )
                     count += 1
@@ -841,29 +1198,49 @@ class PredictionObject(object):
                 last_of_array=last_of_array,
             )
 
+        # check series_weights information, as an array aligned to the metric columns
+        if series_weights is None:
+            # equal weighting, no need to build a weights dict
+            w = None
+            weight_sum = self.per_series_metrics.shape[1]
+        else:
+            w, weight_sum = _aligned_weights(
+                series_weights, self.per_series_metrics.columns
+            )
+
         if per_timestamp_errors:
-            smape_df = abs(self.forecast - actual) / (abs(self.forecast) + abs(actual))
-            weight_mean = np.mean(list(series_weights.values()))
-            wsmape_df = (smape_df * series_weights) / weight_mean
-            smape_cons = (np.nansum(wsmape_df, axis=1) * 200) / np.count_nonzero(
-                ~np.isnan(actual), axis=1
+            if series_weights is None:
+                ts_weights = np.ones(self.forecast.shape[1])
+            else:
+                ts_weights = w / np.mean(list(series_weights.values()))
+            self.per_timestamp = _per_timestamp_smape(
+                _float_values(self.forecast),
+                _float_values(actual),
+                ts_weights,
+                self.full_mae_errors,
             )
-            per_timestamp = pd.DataFrame({'weighted_smape': smape_cons}).transpose()
-            self.per_timestamp = per_timestamp
 
-        # check series_weights information
-        if series_weights is None:
-            series_weights = clean_weights(weights=False, series=self.forecast.columns)
-        # make sure the series_weights are passed correctly to metrics
-        if len(series_weights) != self.forecast.shape[1]:
-            series_weights = {col: series_weights[col] for col in self.forecast.columns}
+        if w is not None and np.all(w == 1):
+            w = None
 
         # this weighting won't work well if entire metrics are NaN
         # but results should still be comparable
-        self.avg_metrics_weighted = (self.per_series_metrics * series_weights).sum(
-            axis=1, skipna=True
-        ) / sum(series_weights.values())
-        self.avg_metrics = self.per_series_metrics.mean(axis=1, skipna=True)
+        metric_index = self.per_series_metrics.index
+        vals = self.per_series_metrics.to_numpy(dtype=np.float64)
+        # one NaN mask and zero filled copy shared by both averages
+        valid = ~np.isnan(vals)
+        vals = np.where(valid, vals, 0.0)
+        # unit weights need no multiply, still NaN as zero over the full weight total
+        weighted = vals if w is None else vals * w
+        self.avg_metrics_weighted = pd.Series(
+            weighted.sum(axis=1) / weight_sum,
+            index=metric_index,
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # all NaN metrics stay NaN, as with nanmean
+            self.avg_metrics = pd.Series(
+                vals.sum(axis=1) / valid.sum(axis=1), index=metric_index
+            )
         return self
 
     def apply_constraints(
@@ -880,7 +1257,7 @@ class PredictionObject(object):
         this can be run twice, with None passed to the upper or lower constraint not being used.
 
         Args:
-            constraint_method (str): one of
+            constraint_method (str): one of, or None to skip constraints
                 stdev_min - threshold is min and max of historic data +/- constraint * st dev of data
                 stdev - threshold is the mean of historic data +/- constraint * st dev of data
                 absolute - input is array of length series containing the threshold's final value for each
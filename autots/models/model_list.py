@@ -1,4 +1,7 @@
 """Lists of models grouped by aspects."""
+import types
+from collections.abc import Mapping
+
 all_models = [
     'ConstantNaive',
     'LastValueNaive',
@@ -47,7 +50,8 @@ all_models = [
     "TiDE",
     "NeuralForecast",
 ]
-all_pragmatic = list((set(all_models) - set(['MLEnsemble', 'VARMAX', 'Greykite'])))
+_impractical_set = frozenset(['MLEnsemble', 'VARMAX', 'Greykite'])
+all_pragmatic = tuple(x for x in all_models if x not in _impractical_set)
 # downweight slower models
 default = {
     'ConstantNaive': 1,
@@ -78,7 +82,7 @@ default = {
     # 'SeasonalityMotif': 1,
 }
 # fastest models at any scale
-superfast = [
+superfast = (
     'ConstantNaive',
     'LastValueNaive',
     'AverageValueNaive',
@@ -86,7 +90,7 @@ superfast = [
     'SeasonalNaive',
     # 'MetricMotif',
     'SeasonalityMotif',
-]
+)
 # relatively fast
 fast = {
     'ConstantNaive': 1,
@@ -127,13 +131,10 @@ parallel = {
     'ARDL': 1,
     'ARCH': 1,
 }
-# models that should be fast given many CPU cores
-fast_parallel = {**parallel, **fast}
-fast_parallel_no_arima = {
-    i: fast_parallel[i]
-    for i in fast_parallel
-    if i
-    not in [
+# models that should be fast given many CPU cores, merged once and read-only
+fast_parallel = types.MappingProxyType({**parallel, **fast})
+_fast_parallel_arima_like = frozenset(
+    [
         'ARIMA',
         'NVAR',
         "UnobservedComponents",
@@ -145,12 +146,21 @@ fast_parallel_no_arima = {
         # "BallTreeMultivariateMotif",  # might need sample_fraction tuning
         # "WindowRegression"  # same base shaping as BallTreeMM
     ]
+)
+fast_parallel_no_arima = {
+    i: weight
+    for i, weight in fast_parallel.items()
+    if i not in _fast_parallel_arima_like
 }
 # so this opiniated and not fully updated always
-best = list(
-    set(
-        list(fast_parallel_no_arima.keys())
-        + ['MultivariateRegression', 'GluonTS', 'PytorchForecasting']
+best = tuple(
+    dict.fromkeys(
+        [
+            *fast_parallel_no_arima,
+            'MultivariateRegression',
+            'GluonTS',
+            'PytorchForecasting',
+        ]
     )
 )
 
@@ -162,16 +172,18 @@ experimental = [
     'TFPRegression',
 ]
 # models that perform slowly at scale
-slow = list((set(all_models) - set(fast.keys())) - set(experimental))
+_fast_set = frozenset(fast)
+_experimental_set = frozenset(experimental)
+slow = tuple(x for x in all_models if x not in _fast_set and x not in _experimental_set)
 # use GPU
-gpu = [
+gpu = (
     'GluonTS',
     'WindowRegression',
     'PytorchForecasting',
     "TiDE",
     "NeuralForecast",
     "NeuralProphet",
-]
+)
 # models with model-based upper/lower forecasts
 probabilistic = [
     'ARIMA',
@@ -222,9 +234,12 @@ multivariate = [
     "TiDE",
     "NeuralForecast",
 ]
-univariate = list((set(all_models) - set(multivariate)) - set(experimental))
+_multivariate_set = frozenset(multivariate)
+univariate = tuple(
+    x for x in all_models if x not in _multivariate_set and x not in _experimental_set
+)
 # USED IN AUTO_MODEL, models with no parameters
-no_params = ['LastValueNaive', 'GLS']
+no_params = ('LastValueNaive', 'GLS')
 # USED IN AUTO_MODEL, ONLY MODELS WHICH CAN ACCEPT RANDOM MIXING OF PARAMS
 recombination_approved = [
     'SeasonalNaive',
@@ -316,7 +331,7 @@ regressor = [
     'PreprocessingRegression',
     "NeuralForecast",
 ]
-motifs = [
+motifs = (
     'UnivariateMotif',
     "MultivariateMotif",
     'SectionalMotif',
@@ -324,7 +339,7 @@ motifs = [
     'MetricMotif',
     'SeasonalityMotif',
     'BallTreeMultivariateMotif',
-]
+)
 regressions = [
     'RollingRegression',
     'WindowRegression',
@@ -333,7 +348,7 @@ regressions = [
     'MultivariateRegression',
     'PreprocessingRegression',
 ]
-no_shared_fast = list(set(no_shared).intersection(set(fast_parallel_no_arima)))
+no_shared_fast = tuple(x for x in no_shared if x in fast_parallel_no_arima)
 # this should be implementable with some models in gluonts
 all_result_path = [
     "UnivariateMotif",
@@ -361,6 +376,16 @@ update_fit = [
     'Cassandra',
     'PreprocessingRegression',
 ]
+
+
+def _frozen(group):
+    """Read-only copy of a model group, a tuple or, for weighted groups, a mapping proxy."""
+    if isinstance(group, Mapping):
+        return types.MappingProxyType(dict(group))
+    return tuple(group)
+
+
+# read-only, as are its values, so they can be shared without defensive copies
 model_lists = {
     "all": all_models,
     "default": default,
@@ -388,6 +413,9 @@ model_lists = {
     "all_pragmatic": all_pragmatic,
     "update_fit": update_fit,
 }
+model_lists = types.MappingProxyType(
+    {name: _frozen(group) for name, group in model_lists.items()}
+)
 
 
 def auto_model_list(n_jobs, n_series, frequency):
@@ -399,10 +427,11 @@ def model_list_to_dict(model_list):
     if model_list in list(model_lists.keys()):
         model_list = model_lists[model_list]
 
-    if isinstance(model_list, dict):
+    if isinstance(model_list, Mapping):
         model_prob = list(model_list.values())
         model_list = [*model_list]
-    elif isinstance(model_list, list):
+    elif isinstance(model_list, (list, tuple)):
+        model_list = list(model_list)
         trs_len = len(model_list)
         model_prob = [1 / trs_len] * trs_len
     else:
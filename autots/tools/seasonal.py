@@ -5,12 +5,67 @@ seasonal
 @author: Colin
 """
 import random
+from bisect import bisect
+from functools import lru_cache
+from itertools import accumulate
 import numpy as np
 import pandas as pd
 from autots.tools.lunar import moon_phase
 from autots.tools.window_functions import sliding_window_view
 from autots.tools.holiday import holiday_flag
 
+# optional, used to fuse the seasonal match distance metrics
+try:
+    from numba import njit, prange
+
+    numba_present = True
+except Exception:
+    numba_present = False
+# smaller window sets use numpy, loading the first numba kernel takes ~0.2s
+_numba_min_size = 1_000_000
+
+
+# lag: probability weight for seasonal_int, -1 is a random int
+_seasonal_int_weights = {
+    -1: 0.1,  # random int
+    1: 0.05,  # previous day
+    2: 0.1,
+    4: 0.05,  # quarters
+    7: 0.15,  # week
+    10: 0.01,
+    12: 0.1,  # months
+    24: 0.1,  # months or hours
+    28: 0.1,  # days in month to weekday
+    60: 0.05,
+    96: 0.04,  # quarter in days
+    168: 0.01,
+    364: 0.1,  # year to weekday
+    1440: 0.01,
+    420: 0.01,
+    52: 0.01,
+    84: 0.01,
+}
+_seasonal_int_lags = list(_seasonal_int_weights)
+_seasonal_int_cum = list(accumulate(_seasonal_int_weights.values()))
+_seasonal_int_total = _seasonal_int_cum[-1] + 0.0
+
+
+def _seasonal_int_draw(include_one):
+    # same draw as random.choices with these weights, without rebuilding them each call
+    while True:
+        lag = _seasonal_int_lags[
+            bisect(
+                _seasonal_int_cum,
+                random.random() * _seasonal_int_total,
+                0,
+                len(_seasonal_int_lags) - 1,
+            )
+        ]
+        if lag == -1:
+            lag = random.randint(2, 100)
+        if include_one or lag != 1:
+            return lag
+
 
 def seasonal_int(include_one: bool = False, small=False, very_small=False):
     """Generate a random integer of typical seasonalities.
@@ -20,39 +75,12 @@ def seasonal_int(include_one: bool = False, small=False, very_small=False):
         small (bool): if True, keep below 364
         very_small (bool): if True keep below 30
     """
-    prob_dict = {
-        -1: 0.1,  # random int
-        1: 0.05,  # previous day
-        2: 0.1,
-        4: 0.05,  # quarters
-        7: 0.15,  # week
-        10: 0.01,
-        12: 0.1,  # months
-        24: 0.1,  # months or hours
-        28: 0.1,  # days in month to weekday
-        60: 0.05,
-        96: 0.04,  # quarter in days
-        168: 0.01,
-        364: 0.1,  # year to weekday
-        1440: 0.01,
-        420: 0.01,
-        52: 0.01,
-        84: 0.01,
-    }
-    lag = random.choices(
-        list(prob_dict.keys()),
-        list(prob_dict.values()),
-        k=1,
-    )[0]
-    if lag == -1:
-        lag = random.randint(2, 100)
-    if not include_one and lag == 1:
-        lag = seasonal_int(include_one=include_one, small=small, very_small=very_small)
+    lag = _seasonal_int_draw(include_one)
     if small:
         lag = lag if lag < 364 else 364
     if very_small:
         while lag > 30:
-            lag = seasonal_int(include_one=include_one, very_small=very_small)
+            lag = _seasonal_int_draw(include_one)
     return int(lag)
 
 
@@ -73,6 +101,461 @@ date_part_methods = [
 origin_ts = "2030-01-01"
 
 
+class _DatetimeParts(dict):
+    """Datetime accessor values of one DatetimeIndex, filled in as they are first used."""
+
+    def __init__(self, DTindex):
+        super().__init__()
+        self.DTindex = DTindex
+
+    def __missing__(self, key):
+        if key in _derived_parts:
+            value = _derived_parts[key](self)
+        else:
+            value = np.asarray(getattr(self.DTindex, key))
+        # shared between calls, so must not be edited by callers
+        value.flags.writeable = False
+        self[key] = value
+        return value
+
+    def fourier_series(self, name, p, n):
+        """fourier_series(t, p, n) with t the part called name, such as "t_days".
+
+        Only the largest n asked for per (name, p) is stored, as smaller orders are its
+        leading cos and sin columns. A new array is returned each time.
+        """
+        key = ('fourier', name, p)
+        cached = self.get(key)
+        if cached is None or cached.shape[1] < 2 * n:
+            cached = fourier_series(self[name], p=p, n=n)
+            cached.flags.writeable = False
+            self[key] = cached
+        cached_n = cached.shape[1] // 2
+        return cached[:, np.r_[0:n, cached_n : cached_n + n]]
+
+    def fourier_interaction(self, name, p1, p2, n):
+        """fourier_series(t, p1, n) * fourier_series(t, p2, n), cached as read only."""
+        key = ('fourier_interaction', name, p1, p2, n)
+        cached = self.get(key)
+        if cached is None:
+            cached = self.fourier_series(name, p1, n)
+            cached *= self.fourier_series(name, p2, n)
+            cached.flags.writeable = False
+            self[key] = cached
+        return cached
+
+
+def _origin_offset(DTindex, origin=origin_ts):
+    """Integer time since origin in the unit of DTindex, and that unit per day and minute.
+
+    None where the offset must come from pandas datetime arithmetic instead, as for NaT.
+    """
+    if getattr(DTindex, 'tz', None) is not None or DTindex.hasnans:
+        return None
+    unit = getattr(DTindex, 'unit', 'ns')
+    origin = np.datetime64(origin, unit).astype(np.int64)
+    per_minute = int(np.timedelta64(1, 'm') // np.timedelta64(1, unit))
+    return DTindex.asi8 - origin, per_minute * 1440, per_minute
+
+
+def _t_days(DTindex):
+    """(DTindex - pd.Timestamp(origin_ts)).days on the integer values."""
+    offset = _origin_offset(DTindex)
+    if offset is None:
+        return np.asarray((DTindex - pd.Timestamp(origin_ts)).days)
+    return offset[0] // offset[1]
+
+
+def _t_hours(DTindex):
+    """Days since origin_ts in hours, plus the minute component of the time since then."""
+    offset = _origin_offset(DTindex)
+    if offset is None:
+        t = DTindex - pd.Timestamp(origin_ts)
+        return np.asarray((t.days * 24) + (t.components['minutes'] / 60))
+    offset, per_day, per_minute = offset
+    days = offset // per_day
+    minutes = (offset - days * per_day) // per_minute % 60
+    return (days * 24) + (minutes / 60)
+
+
+def _julian(DTindex):
+    """DTindex.to_julian_date() from the integer values rather than eight accessors."""
+    offset = _origin_offset(DTindex, "1970-01-01")
+    if offset is None:
+        return np.asarray(DTindex.to_julian_date())
+    offset, per_day, _ = offset
+    days = offset // per_day
+    # the whole day part is exact, leaving one rounding for the time of day
+    return (days + 2440587.5) + (offset - days * per_day) / per_day
+
+
+def _is_weekend(weekday):
+    return weekday > 4
+
+
+def _is_midyear(dayofyear):
+    # 2 season
+    return (dayofyear > 74) & (dayofyear < 258)
+
+
+def _is_election_year(year):
+    # also Olympics
+    return year % 4 == 0
+
+
+# the flags over every possible integer value, year by its remainder of 4
+_weekend_lookup = _is_weekend(np.arange(7)).astype(int)
+_midyear_lookup = _is_midyear(np.arange(367)).astype(int)
+_election_year_lookup = _is_election_year(np.arange(4)).astype(int)
+
+
+def _flag_lookup(values, lookup, flag, mask=None):
+    """flag(values).astype(int) as one gather from lookup when values are integers.
+
+    Float values, from an index with NaT, use flag directly so NaN is 0 as before.
+    """
+    if values.dtype.kind not in "iu":
+        return flag(values).astype(int)
+    return lookup[values if mask is None else values & mask]
+
+
+# parts computed from the index values or other parts rather than read from an accessor
+_derived_parts = {
+    "t_days": lambda parts: _t_days(parts.DTindex),
+    "t_hours": lambda parts: _t_hours(parts.DTindex),
+    "julian": lambda parts: _julian(parts.DTindex),
+    "weekend": lambda parts: _flag_lookup(
+        parts["weekday"], _weekend_lookup, _is_weekend
+    ),
+    "midyear": lambda parts: _flag_lookup(
+        parts["dayofyear"], _midyear_lookup, _is_midyear
+    ),
+    "us_election_year": lambda parts: _flag_lookup(
+        parts["year"], _election_year_lookup, _is_election_year, mask=3
+    ),
+}
+
+_dt_parts_cache = {}
+_dt_parts_cache_size = 16
+
+
+def _dt_parts(DTindex):
+    """Return cached numpy arrays of DTindex accessors such as month, day, weekday.
+
+    The pandas accessors build a new array on every call, and date_part is often called
+    many times on the same index. References are held so ids are not reused while cached.
+    """
+    i8 = DTindex.asi8
+    if len(i8) == 0:
+        return _DatetimeParts(DTindex)
+    key = (id(DTindex), len(i8), i8[0], i8[-1])
+    cached = _dt_parts_cache.get(key)
+    if cached is not None and cached.DTindex is DTindex:
+        return cached
+    parts = _DatetimeParts(DTindex)
+    if len(_dt_parts_cache) >= _dt_parts_cache_size:
+        _dt_parts_cache.pop(next(iter(_dt_parts_cache)))
+    _dt_parts_cache[key] = parts
+    return parts
+
+
+@lru_cache(maxsize=None)
+def _one_hot_lookup(n_categories, dtype):
+    """Identity rows for one-hot encoding plus a trailing all 0 row for unmatched values."""
+    lookup = np.eye(n_categories + 1, n_categories, dtype=dtype)
+    lookup.flags.writeable = False
+    return lookup
+
+
+def _one_hot_array(values, first, n_categories, dtype=float, out=None):
+    """One-hot encode integer values from first to first + n_categories - 1.
+
+    Matches pd.get_dummies of a pd.Categorical with those categories, with values outside
+    the categories (or NaN) encoded as all 0, but fills a single array by row lookup.
+    """
+    codes = np.asarray(values) - first
+    codes = np.where((codes >= 0) & (codes < n_categories), codes, n_categories)
+    lookup = _one_hot_lookup(n_categories, np.dtype(dtype))
+    if out is None:
+        # column major, as pandas stores and pd.get_dummies returns each column contiguous
+        out = np.empty((n_categories, len(codes)), dtype=lookup.dtype).T
+    # codes are all in range, so clip avoids buffering into a strided out
+    return np.take(lookup, codes.astype(np.intp), axis=0, out=out, mode='clip')
+
+
+def _one_hot_names(first, n_categories, prefix):
+    return [f"{prefix}_{x}" for x in range(first, first + n_categories)]
+
+
+def _one_hot(values, first, n_categories, prefix, dtype=float):
+    """One-hot encoding of values as a DataFrame, see _one_hot_array."""
+    return pd.DataFrame(
+        _one_hot_array(values, first, n_categories, dtype),
+        columns=_one_hot_names(first, n_categories, prefix),
+        copy=False,
+    )
+
+
+def _one_hot_frame(columns, float_columns, encodings):
+    """DataFrame of columns followed by float_columns and one-hot encodings.
+
+    The float columns and all the encodings are written into one preallocated float array,
+    so the frame is built from two blocks rather than one per part.
+
+    Args:
+        columns (dict): of name: array, each keeping its own dtype
+        float_columns (dict): of name: array, stored as float
+        encodings (list): of (values, first, n_categories, prefix) tuples for _one_hot_array
+    """
+    n_float = len(float_columns)
+    block = np.empty(
+        (
+            len(next(iter(float_columns.values()))),
+            n_float + sum(x[2] for x in encodings),
+        )
+    )
+    names = list(float_columns)
+    for i, values in enumerate(float_columns.values()):
+        block[:, i] = values
+    start = n_float
+    for values, first, n_categories, prefix in encodings:
+        _one_hot_array(
+            values, first, n_categories, out=block[:, start : start + n_categories]
+        )
+        names.extend(_one_hot_names(first, n_categories, prefix))
+        start += n_categories
+    return pd.concat(
+        [pd.DataFrame(columns), pd.DataFrame(block, columns=names, copy=False)],
+        axis=1,
+    )
+
+
+def _date_part_recurring(DTindex, parts, method):
+    return pd.DataFrame(
+        {
+            'month': parts["month"],
+            'day': parts["day"],
+            'weekday': parts["weekday"],
+            'weekend': parts["weekend"],
+            'hour': parts["hour"],
+            'quarter': parts["quarter"],
+            'midyear': parts["midyear"],  # 2 season
+        }
+    )
+
+
+def _date_part_simple_2(DTindex, parts, method):
+    return pd.DataFrame(
+        {
+            'month': parts["month"],
+            'day': parts["day"],
+            'weekday': parts["weekday"],
+            'weekend': parts["weekend"],
+            # the integer values are what to_numeric returned, without the inference
+            'epoch': DTindex.asi8 / 100000000000,
+        }
+    )
+
+
+def _date_part_simple_3(DTindex, parts, method):
+    # trying to *prevent* it from learning holidays for this one
+    date_part_df = _one_hot_frame(
+        {
+            'weekend': parts["weekend"],
+            'quarter': parts["quarter"],
+        },
+        {'epoch': parts["julian"]},
+        [(parts["month"], 1, 12, 'month'), (parts["weekday"], 0, 7, 'weekday')],
+    )
+    if method == "lunar_phase":
+        date_part_df['phase'] = moon_phase(DTindex)
+    return date_part_df
+
+
+def _date_part_simple_binarized(DTindex, parts, method):
+    return _one_hot_frame(
+        {'day': parts["day"], 'weekend': parts["weekend"]},
+        {'epoch': parts["julian"]},
+        [(parts["month"], 1, 12, 'month'), (parts["weekday"], 0, 7, 'weekday')],
+    )
+
+
+def _date_part_expanded_binarized(DTindex, parts, method):
+    return _one_hot_frame(
+        {
+            'weekend': parts["weekend"],
+            'quarter': parts["quarter"],
+        },
+        {'epoch': parts["julian"]},
+        [
+            (parts["month"], 1, 12, 'month'),
+            (parts["weekday"], 0, 7, 'weekday'),
+            (parts["day"], 1, 31, 'day'),
+            ((parts["day"] - 1) // 7 + 1, 1, 5, 'weekdayofmonth'),
+        ],
+    )
+
+
+def _date_part_common_fourier(DTindex, parts, method):
+    seasonal_list = []
+    DTmin = DTindex.min()
+    DTmax = DTindex.max()
+    # 1 time step will always not work with this
+    # for new seasonal_ratio, worse case scenario is 2 steps ahead so one season / 2
+    # in order to assure error on wrong seasonality choice in train vs test, we must have different sum orders for each seasonality
+    if len(DTindex) <= 1:
+        seasonal_ratio = 1  # assume daily, but weekly or monthly seems more likely for 1 step forecasts
+    else:
+        seasonal_ratio = ((DTmax - DTmin).days + 1) / len(DTindex)
+    # seasonal_ratio = (DTmax.year - DTmin.year + 1) / len(DTindex)  # old ratio
+
+    def basis(p, n):
+        # the same bases are used in several terms and by repeated calls on DTindex
+        return parts.fourier_series(t_name, p, n)
+
+    def interaction(p1, p2, n):
+        return parts.fourier_interaction(t_name, p1, p2, n)
+
+    # hourly
+    # if seasonal_ratio < 0.001:  # 0.00011 to 0.00023
+    if seasonal_ratio < 0.75:  # 0.00011 to 0.00023
+        t_name = 't_hours'
+        # add hourly, weekly, yearly
+        seasonal_list.append(basis(8766, 10))
+        seasonal_list.append(basis(24, 3))
+        seasonal_list.append(basis(168, 5))
+        # interactions
+        seasonal_list.append(interaction(168, 24, 5))
+        seasonal_list.append(interaction(168, 8766, 3))
+    # daily (+ business day)
+    # elif seasonal_ratio < 0.012:  # 0.0027 to 0.0055
+    elif seasonal_ratio < 3.5:  # 0.0027 to 0.0055
+        t_name = 't_days'
+        # add yearly and weekly seasonality
+        seasonal_list.append(basis(365.25, 10))
+        seasonal_list.append(basis(7, 3))
+        # interaction
+        seasonal_list.append(interaction(7, 365.25, 5))
+    # weekly
+    # elif seasonal_ratio < 0.05:  # 0.019 to 0.038
+    elif seasonal_ratio < 12:  # 0.019 to 0.038
+        t_name = 't_days'
+        seasonal_list.append(basis(365.25, 10))
+        seasonal_list.append(basis(28, 4))
+    # monthly
+    # elif seasonal_ratio < 0.5:  # 0.083 to 0.154
+    elif seasonal_ratio < 182:  # 0.083 to 0.154
+        t_name = 't_days'
+        seasonal_list.append(basis(365.25, 3))
+        seasonal_list.append(basis(1461, 10))
+    # yearly
+    else:
+        t_name = 't_days'
+        seasonal_list.append(basis(1461, 10))
+    # one array rounded in place and named directly, rather than rename and round copies
+    values = np.concatenate(seasonal_list, axis=1)
+    np.round(values, 6, out=values)
+    date_part_df = pd.DataFrame(
+        values,
+        columns=[f"seasonalitycommonfourier_{x}" for x in range(values.shape[1])],
+        copy=False,
+    )
+    if method == "common_fourier_rw":
+        date_part_df['epoch'] = (parts["julian"] ** 0.65).astype(int)
+    return date_part_df
+
+
+def _date_part_simple(DTindex, parts, method):
+    # method == "simple"
+    simple = {
+        'year': parts["year"],
+        'month': parts["month"],
+        'day': parts["day"],
+        'weekday': parts["weekday"],
+    }
+    if method == 'expanded':
+        try:
+            weekyear = DTindex.isocalendar().week.to_numpy()
+        except Exception:
+            weekyear = DTindex.week
+        return pd.DataFrame(
+            {
+                **simple,
+                'hour': parts["hour"],
+                'week': weekyear,
+                'quarter': parts["quarter"],
+                'dayofyear': parts["dayofyear"],
+                'midyear': parts["midyear"],  # 2 season
+                'weekend': parts["weekend"],
+                'weekdayofmonth': (parts["day"] - 1) // 7 + 1,
+                'month_end': (parts["is_month_end"]).astype(int),
+                'month_start': (parts["is_month_start"]).astype(int),
+                "quarter_end": (parts["is_quarter_end"]).astype(int),
+                'year_end': (parts["is_year_end"]).astype(int),
+                'daysinmonth': parts["daysinmonth"],
+                'epoch': DTindex.asi8 - 946684800000000000,
+                'us_election_year': parts["us_election_year"],  # also Olympics
+            }
+        )
+    # all four parts share a dtype, so fill one array as a single block,
+    # column major as pandas stores it
+    block = np.empty(
+        (len(simple), len(DTindex)), dtype=np.result_type(*simple.values())
+    ).T
+    for i, values in enumerate(simple.values()):
+        block[:, i] = values
+    return pd.DataFrame(block, columns=list(simple), copy=False)
+
+
+def _date_part_components(DTindex, parts, method):
+    return create_datepart_components(DTindex, method)
+
+
+# date_part builders of the methods matched by name, others are resolved by _date_part_builder
+_date_part_builders = {
+    'recurring': _date_part_recurring,
+    'simple_2': _date_part_simple_2,
+    'simple_2_poly': _date_part_simple_2,
+    'simple_3': _date_part_simple_3,
+    'lunar_phase': _date_part_simple_3,
+    'common_fourier': _date_part_common_fourier,
+    'common_fourier_rw': _date_part_common_fourier,
+}
+
+
+@lru_cache(maxsize=None)
+def _date_part_builder(method):
+    """Builder function taking (DTindex, parts, method) for a date_part method string.
+
+    Resolved once per string in the order of the original checks, as some methods are
+    matched by substring: "simple_binarized" in method, and method in "expanded_binarized"
+    which includes "expanded". Anything unmatched is "simple".
+    """
+    if method in datepart_components:
+        return _date_part_components
+    elif method in _date_part_builders:
+        return _date_part_builders[method]
+    elif "simple_binarized" in method:
+        return _date_part_simple_binarized
+    elif method in "expanded_binarized":
+        return _date_part_expanded_binarized
+    return _date_part_simple
+
+
+def _holiday_flag_frame(DTindex, country):
+    """holiday_flag(DTindex, country, encode_holiday_type=True), cached on the datetime parts.
+
+    Not to be modified, date_part only passes it to pd.concat which copies.
+    """
+    parts = _dt_parts(DTindex)
+    key = ('holiday_flag', repr(country))
+    cached = parts.get(key)
+    if cached is None:
+        cached = holiday_flag(DTindex, country=country, encode_holiday_type=True)
+        parts[key] = cached
+    return cached
+
+
 def date_part(
     DTindex,
     method: str = 'simple',
@@ -109,213 +592,13 @@ def date_part(
     elif "_poly" in str(method):
         method = method.replace("_poly", "")
         polynomial_degree = 2
-
     if isinstance(method, (int, float)):
         date_part_df = fourier_df(DTindex, seasonality=method, order=6)
     elif isinstance(method, list):
         # remove duplicate columns if present
         date_part_df = date_part_df.loc[:, ~date_part_df.columns.duplicated()]
-    elif method in datepart_components:
-        date_part_df = create_datepart_components(DTindex, method)
-    elif method == 'recurring':
-        date_part_df = pd.DataFrame(
-            {
-                'month': DTindex.month,
-                'day': DTindex.day,
-                'weekday': DTindex.weekday,
-                'weekend': (DTindex.weekday > 4).astype(int),
-                'hour': DTindex.hour,
-                'quarter': DTindex.quarter,
-                'midyear': (
-                    (DTindex.dayofyear > 74) & (DTindex.dayofyear < 258)
-                ).astype(
-                    int
-                ),  # 2 season
-            }
-        )
-    elif method in ["simple_2", "simple_2_poly"]:
-        date_part_df = pd.DataFrame(
-            {
-                'month': DTindex.month,
-                'day': DTindex.day,
-                'weekday': DTindex.weekday,
-                'weekend': (DTindex.weekday > 4).astype(int),
-                'epoch': pd.to_numeric(
-                    DTindex, errors='coerce', downcast='integer'
-                ).values
-                / 100000000000,
-            }
-        )
-    elif method in ["simple_3", "lunar_phase"]:
-        # trying to *prevent* it from learning holidays for this one
-        date_part_df = pd.DataFrame(
-            {
-                'month': pd.Categorical(
-                    DTindex.month, categories=list(range(1, 13)), ordered=True
-                ),
-                'weekday': pd.Categorical(
-                    DTindex.weekday, categories=list(range(7)), ordered=True
-                ),
-                'weekend': (DTindex.weekday > 4).astype(int),
-                'quarter': DTindex.quarter,
-                'epoch': DTindex.to_julian_date(),
-            }
-        )
-        # date_part_df['weekday'] = date_part_df['month'].astype(pd.CategoricalDtype(categories=list(range(6))))
-        date_part_df = pd.get_dummies(
-            date_part_df, columns=['month', 'weekday'], dtype=float
-        )
-        if method == "lunar_phase":
-            date_part_df['phase'] = moon_phase(DTindex)
-    elif "simple_binarized" in method:
-        date_part_df = pd.DataFrame(
-            {
-                'month': pd.Categorical(
-                    DTindex.month, categories=list(range(1, 13)), ordered=True
-                ),
-                'weekday': pd.Categorical(
-                    DTindex.weekday, categories=list(range(7)), ordered=True
-                ),
-                'day': DTindex.day,
-                'weekend': (DTindex.weekday > 4).astype(int),
-                'epoch': DTindex.to_julian_date(),
-            }
-        )
-        date_part_df = pd.get_dummies(
-            date_part_df, columns=['month', 'weekday'], dtype=float
-        )
-    elif method in "expanded_binarized":
-        date_part_df = pd.DataFrame(
-            {
-                'month': pd.Categorical(
-                    DTindex.month, categories=list(range(1, 13)), ordered=True
-                ),
-                'weekday': pd.Categorical(
-                    DTindex.weekday, categories=list(range(7)), ordered=True
-                ),
-                'day': pd.Categorical(
-                    DTindex.day, categories=list(range(1, 32)), ordered=True
-                ),
-                'weekdayofmonth': pd.Categorical(
-                    (DTindex.day - 1) // 7 + 1,
-                    categories=list(range(1, 6)),
-                    ordered=True,
-                ),
-                'weekend': (DTindex.weekday > 4).astype(int),
-                'quarter': DTindex.quarter,
-                'epoch': DTindex.to_julian_date(),
-            }
-        )
-        date_part_df = pd.get_dummies(
-            date_part_df,
-            columns=['month', 'weekday', 'day', 'weekdayofmonth'],
-            dtype=float,
-        )
-    elif method in ["common_fourier", "common_fourier_rw"]:
-        seasonal_list = []
-        DTmin = DTindex.min()
-        DTmax = DTindex.max()
-        # 1 time step will always not work with this
-        # for new seasonal_ratio, worse case scenario is 2 steps ahead so one season / 2
-        # in order to assure error on wrong seasonality choice in train vs test, we must have different sum orders for each seasonality
-        if len(DTindex) <= 1:
-            seasonal_ratio = 1  # assume daily, but weekly or monthly seems more likely for 1 step forecasts
-        else:
-            seasonal_ratio = ((DTmax - DTmin).days + 1) / len(DTindex)
-        # seasonal_ratio = (DTmax.year - DTmin.year + 1) / len(DTindex)  # old ratio
-        # hourly
-        # if seasonal_ratio < 0.001:  # 0.00011 to 0.00023
-        if seasonal_ratio < 0.75:  # 0.00011 to 0.00023
-            t = DTindex - pd.Timestamp(origin_ts)
-            t = (t.days * 24) + (t.components['minutes'] / 60)
-            # add hourly, weekly, yearly
-            seasonal_list.append(fourier_series(t, p=8766, n=10))
-            seasonal_list.append(fourier_series(t, p=24, n=3))
-            seasonal_list.append(fourier_series(t, p=168, n=5))
-            # interactions
-            seasonal_list.append(
-                fourier_series(t, p=168, n=5) * fourier_series(t, p=24, n=5)
-            )
-            seasonal_list.append(
-                fourier_series(t, p=168, n=3) * fourier_series(t, p=8766, n=3)
-            )
-        # daily (+ business day)
-        # elif seasonal_ratio < 0.012:  # 0.0027 to 0.0055
-        elif seasonal_ratio < 3.5:  # 0.0027 to 0.0055
-            t = (DTindex - pd.Timestamp(origin_ts)).days
-            # add yearly and weekly seasonality
-            seasonal_list.append(fourier_series(t, p=365.25, n=10))
-            seasonal_list.append(fourier_series(t, p=7, n=3))
-            # interaction
-            seasonal_list.append(
-                fourier_series(t, p=7, n=5) * fourier_series(t, p=365.25, n=5)
-            )
-        # weekly
-        # elif seasonal_ratio < 0.05:  # 0.019 to 0.038
-        elif seasonal_ratio < 12:  # 0.019 to 0.038
-            t = (DTindex - pd.Timestamp(origin_ts)).days
-            seasonal_list.append(fourier_series(t, p=365.25, n=10))
-            seasonal_list.append(fourier_series(t, p=28, n=4))
-        # monthly
-        # elif seasonal_ratio < 0.5:  # 0.083 to 0.154
-        elif seasonal_ratio < 182:  # 0.083 to 0.154
-            t = (DTindex - pd.Timestamp(origin_ts)).days
-            seasonal_list.append(fourier_series(t, p=365.25, n=3))
-            seasonal_list.append(fourier_series(t, p=1461, n=10))
-        # yearly
-        else:
-            t = (DTindex - pd.Timestamp(origin_ts)).days
-            seasonal_list.append(fourier_series(t, p=1461, n=10))
-        date_part_df = (
-            pd.DataFrame(np.concatenate(seasonal_list, axis=1))
-            .rename(columns=lambda x: "seasonalitycommonfourier_" + str(x))
-            .round(6)
-        )
-        if method == "common_fourier_rw":
-            date_part_df['epoch'] = (DTindex.to_julian_date() ** 0.65).astype(int)
     else:
-        # method == "simple"
-        date_part_df = pd.DataFrame(
-            {
-                'year': DTindex.year,
-                'month': DTindex.month,
-                'day': DTindex.day,
-                'weekday': DTindex.weekday,
-            }
-        )
-        if method == 'expanded':
-            try:
-                weekyear = DTindex.isocalendar().week.to_numpy()
-            except Exception:
-                weekyear = DTindex.week
-            date_part_df2 = pd.DataFrame(
-                {
-                    'hour': DTindex.hour,
-                    'week': weekyear,
-                    'quarter': DTindex.quarter,
-                    'dayofyear': DTindex.dayofyear,
-                    'midyear': (
-                        (DTindex.dayofyear > 74) & (DTindex.dayofyear < 258)
-                    ).astype(
-                        int
-                    ),  # 2 season
-                    'weekend': (DTindex.weekday > 4).astype(int),
-                    'weekdayofmonth': (DTindex.day - 1) // 7 + 1,
-                    'month_end': (DTindex.is_month_end).astype(int),
-                    'month_start': (DTindex.is_month_start).astype(int),
-                    "quarter_end": (DTindex.is_quarter_end).astype(int),
-                    'year_end': (DTindex.is_year_end).astype(int),
-                    'daysinmonth': DTindex.daysinmonth,
-                    'epoch': pd.to_numeric(
-                        DTindex, errors='coerce', downcast='integer'
-                    ).values
-                    - 946684800000000000,
-                    'us_election_year': (DTindex.year % 4 == 0).astype(
-                        int
-                    ),  # also Olympics
-                }
-            )
-            date_part_df = pd.concat([date_part_df, date_part_df2], axis=1)
+        date_part_df = _date_part_builder(method)(DTindex, _dt_parts(DTindex), method)
 
     if polynomial_degree is not None:
         from sklearn.preprocessing import PolynomialFeatures
@@ -334,9 +617,7 @@ def date_part(
         date_part_df = pd.concat(
             [
                 date_part_df,
-                holiday_flag(
-                    DTindex, country=holiday_country, encode_holiday_type=True
-                ),
+                _holiday_flag_frame(DTindex, holiday_country),
             ],
             axis=1,
             ignore_index=not set_index,
@@ -349,18 +630,25 @@ def fourier_series(t, p=365.25, n=10):
     x = 2 * np.pi * np.arange(1, n + 1) / p
     # 2 pi n / p * t
     x = x * np.asarray(t)[:, None]
-    x = np.concatenate((np.cos(x), np.sin(x)), axis=1)
-    return x
+    # write cos and sin straight into their halves rather than concatenating copies
+    out = np.empty((x.shape[0], 2 * n), dtype=x.dtype)
+    np.cos(x, out=out[:, :n])
+    np.sin(x, out=out[:, n:])
+    return out
 
 
 def fourier_df(DTindex, seasonality, order=10, t=None, history_days=None):
     if history_days is None:
         history_days = (DTindex.max() - DTindex.min()).days
     if t is None:
-        t = (DTindex - pd.Timestamp(origin_ts)).days
-    return pd.DataFrame(
-        fourier_series(np.asarray(t), seasonality / history_days, n=order)
-    ).rename(columns=lambda x: f"seasonality{seasonality}_" + str(x))
+        fourier = _dt_parts(DTindex).fourier_series(
+            't_days', seasonality / history_days, order
+        )
+    else:
+        fourier = fourier_series(np.asarray(t), seasonality / history_days, n=order)
+    return pd.DataFrame(fourier).rename(
+        columns=lambda x: f"seasonality{seasonality}_" + str(x)
+    )
 
 
 datepart_components = [
@@ -383,91 +671,74 @@ datepart_components = [
 ]
 
 
+def _calendar_codes(seasonality, parts):
+    """Integer codes whose digits are the string keys of the calendar components.
+
+    weekdaymonthofyear is month then week of month and weekday, with weeks past the fourth
+    as 50, as "1" + "23" for the 2nd week of January, a Thursday. dayofmonthofyear is
+    month then day, where days past the 9th take two digits, so January 11th and November
+    1st share a code as they share the string "111".
+    """
+    month, day = parts["month"], parts["day"]
+    if seasonality == "weekdaymonthofyear":
+        weekday = parts["weekday"]
+        # because not much data for last week (week 5) of months unless many years of data
+        monweek = np.minimum(((day - 1) // 7 + 1) * 10 + weekday, 50)
+        return month * 100 + monweek
+    return month * np.where(day < 10, 10, 100) + day
+
+
+@lru_cache(maxsize=None)
+def _calendar_categories(seasonality):
+    """Codes of seasonality in order of first appearance in a leap year, and a code lookup.
+
+    The lookup maps each code to its position, with unknown codes past the end.
+    """
+    cat_index = pd.date_range(
+        "2020-01-01", "2021-01-01", freq='D'
+    )  # must be a leap year
+    cats = pd.unique(_calendar_codes(seasonality, _DatetimeParts(cat_index)))
+    lookup = np.full(cats.max() + 1, len(cats), dtype=np.intp)
+    lookup[cats] = np.arange(len(cats))
+    cats.flags.writeable = False
+    lookup.flags.writeable = False
+    return cats, lookup
+
+
 def create_datepart_components(DTindex, seasonality):
     """single date part one-hot flags."""
+    parts = _dt_parts(DTindex)
     if seasonality == "dayofweek":
-        return pd.get_dummies(
-            pd.Categorical(DTindex.weekday, categories=list(range(7)), ordered=True),
-            dtype=np.uint8,
-        ).rename(columns=lambda x: f"{seasonality}_" + str(x))
+        return _one_hot(parts["weekday"], 0, 7, seasonality, np.uint8)
     elif seasonality == "month":
-        return pd.get_dummies(
-            pd.Categorical(DTindex.month, categories=list(range(1, 13)), ordered=True),
-            dtype=np.uint8,
-        ).rename(columns=lambda x: f"{seasonality}_" + str(x))
+        return _one_hot(parts["month"], 1, 12, seasonality, np.uint8)
     elif seasonality == "day":
-        return pd.get_dummies(
-            pd.Categorical(DTindex.day, categories=list(range(1, 32)), ordered=True),
-            dtype=np.uint8,
-        ).rename(columns=lambda x: f"{seasonality}_" + str(x))
+        return _one_hot(parts["day"], 1, 31, seasonality, np.uint8)
     elif seasonality == "weekend":
-        return pd.DataFrame((DTindex.weekday > 4).astype(int), columns=["weekend"])
+        return pd.DataFrame({"weekend": parts["weekend"]})
     elif seasonality == "weekdayofmonth":
-        return pd.get_dummies(
-            pd.Categorical(
-                (DTindex.day - 1) // 7 + 1,
-                categories=list(range(1, 6)),
-                ordered=True,
-            ),
-            dtype=float,
-        ).rename(columns=lambda x: f"{seasonality}_" + str(x))
+        return _one_hot((parts["day"] - 1) // 7 + 1, 1, 5, seasonality)
     # recommend used in combination with some combination like dayofweek and quarter
-    elif seasonality == "weekdaymonthofyear":
-        monweek = (
-            ((DTindex.day - 1) // 7 + 1).astype(str) + (DTindex.weekday).astype(str)
-        ).astype(int)
-        # because not much data for last week (week 5) of months unless many years of data
-        monweek = monweek.where(monweek <= 50, 50)
-        strs = DTindex.month.astype(str) + monweek.astype(str)
-        cat_index = pd.date_range(
-            "2020-01-01", "2021-01-01", freq='D'
-        )  # must be a leap year
-        catweek = (
-            ((cat_index.day - 1) // 7 + 1).astype(str) + (cat_index.weekday).astype(str)
-        ).astype(int)
-        catweek = catweek.where(catweek <= 50, 50)
-        cats = (cat_index.month.astype(str) + catweek.astype(str)).unique()
-        return pd.get_dummies(
-            pd.Categorical(
-                strs,
-                categories=cats,
-                ordered=False,
-            ),
-            dtype=float,
-        ).rename(columns=lambda x: f"{seasonality}_" + str(x))
-    elif seasonality == "dayofmonthofyear":
-        strs = DTindex.month.astype(str) + DTindex.day.astype(str)
-        cat_index = pd.date_range(
-            "2020-01-01", "2021-01-01", freq='D'
-        )  # must be a leap yaer
-        cats = (cat_index.month.astype(str) + cat_index.day.astype(str)).unique()
-        return pd.get_dummies(
-            pd.Categorical(
-                strs,
-                categories=cats,
-                ordered=False,
-            ),
-            dtype=float,
-        ).rename(columns=lambda x: f"{seasonality}_" + str(x))
+    elif seasonality in ["weekdaymonthofyear", "dayofmonthofyear"]:
+        cats, lookup = _calendar_categories(seasonality)
+        codes = _calendar_codes(seasonality, parts)
+        # NaT gives NaN codes, left past the end so their rows are all 0
+        positions = np.full(len(codes), len(cats), dtype=np.intp)
+        valid = ~np.isnan(codes) if codes.dtype.kind == "f" else slice(None)
+        positions[valid] = lookup[codes[valid].astype(np.intp)]
+        return pd.DataFrame(
+            _one_hot_array(positions, 0, len(cats)),
+            columns=[f"{seasonality}_{x}" for x in cats],
+            copy=False,
+        )
     elif seasonality == "hour":
-        return pd.get_dummies(
-            pd.Categorical(DTindex.hour, categories=list(range(1, 25)), ordered=True),
-            dtype=np.uint8,
-        ).rename(columns=lambda x: f"{seasonality}_" + str(x))
+        return _one_hot(parts["hour"], 1, 24, seasonality, np.uint8)
     elif seasonality == "daysinmonth":
         return pd.DataFrame({'daysinmonth': DTindex.daysinmonth})
     elif seasonality == "quarter":
-        return pd.get_dummies(
-            pd.Categorical(DTindex.quarter, categories=list(range(1, 5)), ordered=True),
-            dtype=np.uint8,
-        ).rename(columns=lambda x: f"{seasonality}_" + str(x))
+        return _one_hot(parts["quarter"], 1, 4, seasonality, np.uint8)
     elif seasonality == "dayofyear":
-        return pd.get_dummies(
-            pd.Categorical(
-                DTindex.dayofyear, categories=list(range(1, 367)), ordered=True
-            ),
-            dtype=np.uint16,
-        ).rename(columns=lambda x: f"{seasonality}_" + str(x))
+        return _one_hot(parts["dayofyear"], 1, 366, seasonality, np.uint16)
     elif seasonality == "is_month_end":
         return pd.DataFrame({'is_month_end': DTindex.is_month_end})
     elif seasonality == "is_month_start":
@@ -533,6 +804,255 @@ def random_datepart(method='random'):
     return seasonalities
 
 
+# codes of the distance metrics for _match_scores_nb, mqae always uses numpy
+_match_metrics = {
+    "mae": 0,
+    "canberra": 1,
+    "minkowski": 2,
+    "euclidean": 3,
+    "chebyshev": 4,
+    "mqae": 5,
+    "mse": 6,
+}
+
+if numba_present:
+
+    @njit(cache=True)
+    def _block_sum_nb(a, start, n):
+        """Sum of up to 128 values from a[start], as numpy's pairwise sum does its blocks."""
+        if n < 8:
+            res = 0.0
+            for i in range(start, start + n):
+                res += a[i]
+            return res
+        r0, r1, r2, r3 = a[start], a[start + 1], a[start + 2], a[start + 3]
+        r4, r5, r6, r7 = a[start + 4], a[start + 5], a[start + 6], a[start + 7]
+        i = 8
+        while i < n - (n % 8):
+            r0 += a[start + i]
+            r1 += a[start + i + 1]
+            r2 += a[start + i + 2]
+            r3 += a[start + i + 3]
+            r4 += a[start + i + 4]
+            r5 += a[start + i + 5]
+            r6 += a[start + i + 6]
+            r7 += a[start + i + 7]
+            i += 8
+        res = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+        while i < n:
+            res += a[start + i]
+            i += 1
+        return res
+
+    @njit(cache=True)
+    def _pairwise_run_nb(a, start, n):
+        """Pairwise sum of a[start : start + n] as numpy sums one inner loop.
+
+        numpy halves runs longer than 128 recursively, here walked with a stack, as
+        recursive functions cannot be cached by numba.
+        """
+        if n <= 128:
+            return _block_sum_nb(a, start, n)
+        starts = np.empty(64, dtype=np.int64)
+        lengths = np.empty(64, dtype=np.int64)
+        # 0 for a new run, 1 while its left half is summed, 2 while its right half is
+        stages = np.zeros(64, dtype=np.int64)
+        partial = np.empty(64)
+        top = 0
+        starts[0] = start
+        lengths[0] = n
+        while True:
+            m = lengths[top]
+            if m > 128:
+                stages[top] = 1
+                half = m // 2
+                half -= half % 8
+                starts[top + 1] = starts[top]
+                lengths[top + 1] = half
+                stages[top + 1] = 0
+                top += 1
+                continue
+            total = _block_sum_nb(a, starts[top], m)
+            top -= 1
+            while top >= 0 and stages[top] == 2:
+                total = partial[top] + total
+                top -= 1
+            if top < 0:
+                return total
+            # left half done, continue with the right half
+            partial[top] = total
+            stages[top] = 2
+            half = lengths[top] // 2
+            half -= half % 8
+            starts[top + 1] = starts[top] + half
+            lengths[top + 1] = lengths[top] - half
+            stages[top + 1] = 0
+            top += 1
+
+    @njit(cache=True)
+    def _pairwise_sum_nb(a, n):
+        """Sum of a[:n] in the same order as np.add.reduce of a contiguous axis.
+
+        The reduction runs in buffers of 8192 values, each summed pairwise.
+        """
+        total = 0.0
+        for start in range(0, n, 8192):
+            total += _pairwise_run_nb(a, start, min(8192, n - start))
+        return total
+
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def _match_scores_nb(x, y, metric, out):
+        """Distance of each x[i, j] to y[j] along the last axis into out, see _match_scores.
+
+        Sums are pairwise as numpy reduces a contiguous last axis, so scores are identical.
+        """
+        n_i, n_j, n_k = x.shape
+        for i in prange(n_i):
+            buf = np.empty(n_k)
+            for j in range(n_j):
+                if metric == 4:
+                    total = 0.0
+                    for k in range(n_k):
+                        d = abs(np.float64(x[i, j, k]) - np.float64(y[j, k]))
+                        # NaN propagates, as with np.max
+                        if d > total or np.isnan(d):
+                            total = d
+                    out[i, j] = total
+                    continue
+                for k in range(n_k):
+                    xv = np.float64(x[i, j, k])
+                    yv = np.float64(y[j, k])
+                    d = abs(xv - yv)
+                    if metric == 1:
+                        divisor = abs(xv) + abs(yv)
+                        if divisor == 0:
+                            divisor = 1.0
+                        d = d / divisor
+                    elif metric != 0:
+                        d = d * d
+                    buf[k] = d
+                total = _pairwise_sum_nb(buf, n_k)
+                if metric == 2 or metric == 3:
+                    # the root is taken by _match_scores
+                    out[i, j] = total
+                else:
+                    out[i, j] = total / n_k
+
+
+def _match_scores(x, y, distance_metric):
+    """Distance between x of shape (i, j, k) and y of shape (j, k) along the last axis.
+
+    Returns:
+        np.array of shape (i, j)
+    """
+    if distance_metric not in _match_metrics:
+        raise ValueError(f"distance_metric: {distance_metric} not recognized")
+    if (
+        numba_present
+        and distance_metric != "mqae"
+        and max(x.size, y.size) >= _numba_min_size
+        and x.dtype.kind in "if"
+        and y.dtype.kind in "if"
+        and x.strides[-1] == x.itemsize
+        and y.strides[-1] == y.itemsize
+    ):
+        # numpy reduces such a contiguous last axis pairwise, as the kernel does,
+        # other layouts sum in another order so use numpy to keep the scores identical
+        x = np.broadcast_to(x, np.broadcast_shapes(x.shape, y.shape))
+        # same memory layout as the numpy scores, as it sets the order of later means
+        out = np.empty_like(x[..., 0], dtype=np.float64)
+        _match_scores_nb(x, y, _match_metrics[distance_metric], out)
+        if (
+            distance_metric == "minkowski"
+            and x.dtype.kind == "i"
+            and y.dtype.kind == "i"
+        ):
+            # numpy raises an integer sum to the power 1 / p with the power ufunc,
+            # a float sum takes the sqrt fast path
+            np.power(out, 0.5, out=out)
+        elif distance_metric in ["minkowski", "euclidean"]:
+            np.sqrt(out, out=out)
+        return out
+    if distance_metric == "mae":
+        scores = np.mean(np.abs(x - y), axis=2)
+    elif distance_metric == "canberra":
+        divisor = np.abs(x) + np.abs(y)
+        divisor[divisor == 0] = 1
+        scores = np.mean(np.abs(x - y) / divisor, axis=2)
+    elif distance_metric == "minkowski":
+        p = 2
+        scores = np.sum(np.abs(x - y) ** p, axis=2) ** (1 / p)
+    elif distance_metric == "euclidean":
+        scores = np.sqrt(np.sum((x - y) ** 2, axis=2))
+    elif distance_metric == "chebyshev":
+        scores = np.max(np.abs(x - y), axis=2)
+    elif distance_metric == "mqae":
+        q = 0.85
+        ae = np.abs(x - y)
+        if ae.shape[2] <= 1:
+            vals = ae
+        else:
+            qi = int(ae.shape[2] * q)
+            qi = qi if qi > 1 else 1
+            vals = np.partition(ae, qi, axis=2)[..., :qi]
+        scores = np.mean(vals, axis=2)
+    elif distance_metric == "mse":
+        scores = np.mean((x - y) ** 2, axis=2)
+    return scores
+
+
+# scipy cdist metric and divisor (1 or the number of features) matching each distance
+_cdist_metrics = {
+    "mae": ("cityblock", True),
+    "canberra": ("canberra", True),
+    "minkowski": ("euclidean", False),
+    "euclidean": ("euclidean", False),
+    "chebyshev": ("chebyshev", False),
+    "mse": ("sqeuclidean", True),
+}
+
+
+def _pairwise_scores(a, b, distance_metric, block_size=256):
+    """Distance between each row of a (n, k) and each row of b (m, k), shape (n, m).
+
+    Uses scipy cdist where the metric maps to one, else _match_scores on blocks of rows
+    so the (n, m, k) differences are never held at once.
+    """
+    if distance_metric in _cdist_metrics:
+        try:
+            from scipy.spatial.distance import cdist
+        except Exception:
+            pass
+        else:
+            metric, scale = _cdist_metrics[distance_metric]
+            scores = cdist(a, b, metric=metric)
+            if scale:
+                scores /= a.shape[1]
+            return scores
+    return np.concatenate(
+        [
+            _match_scores(a[i : i + block_size, None], b, distance_metric)
+            for i in range(0, max(a.shape[0], 1), block_size)
+        ],
+        axis=0,
+    )
+
+
+def _date_part_array(DTindex, method):
+    """date_part(DTindex, method).to_numpy(), read only and cached on the datetime parts.
+
+    The seasonal match functions are called repeatedly on the same history index.
+    """
+    parts = _dt_parts(DTindex)
+    key = ('date_part', repr(method))
+    cached = parts.get(key)
+    if cached is None:
+        cached = date_part(DTindex, method=method).to_numpy()
+        cached.flags.writeable = False
+        parts[key] = cached
+    return cached
+
+
 def seasonal_window_match(
     DTindex,
     k,
@@ -542,7 +1062,8 @@ def seasonal_window_match(
     distance_metric,
     full_sort=False,
 ):
-    array = date_part(DTindex, method=datepart_method).to_numpy()
+    # kept in the date_part layout, it sets the summation order of the scores
+    array = _date_part_array(DTindex, datepart_method)
 
     # when k is larger, can be more aggressive on allowing a longer portion into view
     min_k = 5
@@ -554,33 +1075,7 @@ def seasonal_window_match(
     temp = sliding_window_view(array[:-n_tail, :], window_size, axis=0)
     # compare windows by metrics
     last_window = array[-window_size:, :]
-    if distance_metric == "mae":
-        scores = np.mean(np.abs(temp - last_window.T), axis=2)
-    elif distance_metric == "canberra":
-        divisor = np.abs(temp) + np.abs(last_window.T)
-        divisor[divisor == 0] = 1
-        scores = np.mean(np.abs(temp - last_window.T) / divisor, axis=2)
-    elif distance_metric == "minkowski":
-        p = 2
-        scores = np.sum(np.abs(temp - last_window.T) ** p, axis=2) ** (1 / p)
-    elif distance_metric == "euclidean":
-        scores = np.sqrt(np.sum((temp - last_window.T) ** 2, axis=2))
-    elif distance_metric == "chebyshev":
-        scores = np.max(np.abs(temp - last_window.T), axis=2)
-    elif distance_metric == "mqae":
-        q = 0.85
-        ae = np.abs(temp - last_window.T)
-        if ae.shape[2] <= 1:
-            vals = ae
-        else:
-            qi = int(ae.shape[2] * q)
-            qi = qi if qi > 1 else 1
-            vals = np.partition(ae, qi, axis=2)[..., :qi]
-        scores = np.mean(vals, axis=2)
-    elif distance_metric == "mse":
-        scores = np.mean((temp - last_window.T) ** 2, axis=2)
-    else:
-        raise ValueError(f"distance_metric: {distance_metric} not recognized")
+    scores = _match_scores(temp, last_window.T, distance_metric)
 
     # select smallest windows
     if full_sort:
@@ -611,43 +1106,16 @@ def seasonal_independent_match(
     full_sort=False,
     nan_array=None,
 ):
-    array = date_part(DTindex, method=datepart_method)
+    array = _date_part_array(DTindex, datepart_method)
     if nan_array is not None:
-        array[nan_array] = np.inf
-    future_array = date_part(DTindex_future, method=datepart_method).to_numpy()
+        array = array.astype(float)
+        array[np.asarray(nan_array)] = np.inf
+    future_array = _date_part_array(DTindex_future, datepart_method)
 
     # when k is larger, can be more aggressive on allowing a longer portion into view
     min_k = 5
     # compare windows by metrics
-    a = array.to_numpy()[:, None]
-    b = future_array
-    if distance_metric == "mae":
-        scores = np.mean(np.abs(a - b), axis=2)
-    elif distance_metric == "canberra":
-        divisor = np.abs(a) + np.abs(b)
-        divisor[divisor == 0] = 1
-        scores = np.mean(np.abs(a - b) / divisor, axis=2)
-    elif distance_metric == "minkowski":
-        p = 2
-        scores = np.sum(np.abs(a - b) ** p, axis=2) ** (1 / p)
-    elif distance_metric == "euclidean":
-        scores = np.sqrt(np.sum((a - b) ** 2, axis=2))
-    elif distance_metric == "chebyshev":
-        scores = np.max(np.abs(a - b), axis=2)
-    elif distance_metric == "mqae":
-        q = 0.85
-        ae = np.abs(a - b)
-        if ae.shape[2] <= 1:
-            vals = ae
-        else:
-            qi = int(ae.shape[2] * q)
-            qi = qi if qi > 1 else 1
-            vals = np.partition(ae, qi, axis=2)[..., :qi]
-        scores = np.mean(vals, axis=2)
-    elif distance_metric == "mse":
-        scores = np.mean((a - b) ** 2, axis=2)
-    else:
-        raise ValueError(f"distance_metric: {distance_metric} not recognized")
+    scores = _pairwise_scores(array, future_array, distance_metric)
 
     # select smallest windows
     if full_sort:
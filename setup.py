@@ -24,7 +24,11 @@ extras = {
         'pytrends',
         'matplotlib',
         'requests',
-    ]
+    ],
+    'speedups': [
+        'numba',
+        'orjson',
+    ],
 }
 
 with open("README.md", "r") as fh:
@@ -8,7 +8,9 @@ from autots import load_daily
 from autots.tools.calendar import gregorian_to_chinese, gregorian_to_islamic, gregorian_to_hebrew
 from autots.tools.lunar import moon_phase
 from autots.tools.holiday import holiday_flag
-from autots.tools.seasonal import date_part
+from unittest import mock
+from autots.tools import seasonal
+from autots.tools.seasonal import date_part, seasonal_window_match
 
 
 class TestCalendar(unittest.TestCase):
@@ -161,3 +163,53 @@ class TestSeasonal(unittest.TestCase):
              "Washington's Birthday",
          ]
         self.assertCountEqual(date_part_df.columns.tolist(), expected_cols)
+
+    def test_date_part_cache(self):
+        print("Starting test_date_part_cache")
+        input_dates = pd.date_range("2021-01-01", "2021-03-01", freq='D')
+        first = date_part(input_dates, method="simple")
+        # editing a result must not leak into the cached datetime parts
+        first.iloc[:, :] = 0
+        second = date_part(input_dates, method="simple")
+        expected = date_part(input_dates.copy(deep=True), method="simple")
+        pd.testing.assert_frame_equal(second, expected)
+        self.assertEqual(second['year'].iloc[0], 2021)
+        # NaT is encoded as an all 0 row
+        nat_dates = pd.DatetimeIndex(["2021-01-11", None, "2021-11-01"])
+        for method in ["dayofmonthofyear", "weekdaymonthofyear"]:
+            result = date_part(nat_dates, method=method)
+            self.assertEqual(result.sum(axis=1).tolist(), [1.0, 0.0, 1.0])
+        result = date_part(nat_dates, method="dayofmonthofyear")
+        self.assertEqual(result.loc[nat_dates[0], "dayofmonthofyear_111"], 1)
+
+    def test_date_part_holiday_cache(self):
+        print("Starting test_date_part_holiday_cache")
+        input_dates = pd.date_range("2021-01-01", "2021-12-31", freq='D')
+        first = date_part(input_dates, method="simple", holiday_country="US")
+        first.iloc[:, 4:] = 99
+        second = date_part(input_dates, method="simple", holiday_country="US")
+        expected = date_part(
+            input_dates.copy(deep=True), method="simple", holiday_country="US"
+        )
+        pd.testing.assert_frame_equal(second, expected)
+        self.assertFalse((second.iloc[:, 4:] == 99).any().any())
+
+    def test_window_match_numpy_fallback(self):
+        print("Starting test_window_match_numpy_fallback")
+        input_dates = pd.date_range("2021-01-01", "2022-01-01", freq='D')
+        for method in ["simple_binarized", "simple_poly", "dayofweek", [7, 365.25]]:
+            for metric in ["mae", "canberra", "minkowski", "euclidean", "chebyshev", "mqae", "mse"]:
+                # small inputs skip the kernel, force it
+                with mock.patch.object(seasonal, "_numba_min_size", 0):
+                    test, scores = seasonal_window_match(
+                        input_dates, 10, 14, 7, method, metric, full_sort=True
+                    )
+                with mock.patch.object(seasonal, "numba_present", False):
+                    test_np, scores_np = seasonal_window_match(
+                        input_dates, 10, 14, 7, method, metric, full_sort=True
+                    )
+                msg = f"{method} {metric}"
+                # identical scores, so ties between windows break the same way
+                np.testing.assert_array_equal(scores, scores_np, err_msg=msg)
+                np.testing.assert_array_equal(test, test_np, err_msg=msg)
+                self.assertEqual(test.shape, (7, 10))
@@ -3,7 +3,9 @@
 import unittest
 import numpy as np
 import pandas as pd
-from autots.models.base import PredictionObject
+from unittest import mock
+from autots.models import base
+from autots.models.base import PredictionObject, apply_constraints
 
 
 class TestMetrics(unittest.TestCase):
@@ -80,9 +82,90 @@ class TestMetrics(unittest.TestCase):
         self.assertTrue((pred_weighted_avg == known_avg_metrics_weighted).all())
         self.assertTrue((b_avg == b_avg_metrics).all())
 
+    def test_per_timestamp(self):
+        predictions = PredictionObject()
+        predictions.forecast = pd.DataFrame({
+            'a': [-10, 10, 10, -10, 0],
+            'b': [0, 0, 0, 10, 10],
+            'c': [np.nan, np.nan, np.nan, np.nan, np.nan]
+        })
+        predictions.upper_forecast = predictions.forecast + 1
+        predictions.lower_forecast = predictions.forecast - 1
+        actual = pd.DataFrame({
+            'a': [-10, 10, 10, -10, 0],
+            'b': [0, 10, 0, 0, 10],
+            'c': [np.nan, np.nan, np.nan, np.nan, np.nan]
+        })
+        weights = {'a': 10, 'b': 1, 'c': 1}
+        known = np.array([0., 25., 0., 25., 0.])
+        predictions.evaluate(actual, series_weights=weights, per_timestamp_errors=True)
+        np.testing.assert_allclose(predictions.per_timestamp.loc['weighted_smape'], known)
+        # small inputs skip the kernel, force it
+        with mock.patch.object(base, "_numba_min_size", 0):
+            predictions.evaluate(actual, series_weights=weights, per_timestamp_errors=True)
+            np.testing.assert_allclose(predictions.per_timestamp.loc['weighted_smape'], known)
+        # numpy path when numba is not installed
+        with mock.patch.object(base, "numba_present", False):
+            predictions.evaluate(actual, series_weights=weights, per_timestamp_errors=True)
+            np.testing.assert_allclose(predictions.per_timestamp.loc['weighted_smape'], known)
+
+    def test_per_timestamp_inputs_edited(self):
+        predictions = PredictionObject()
+        predictions.forecast = pd.DataFrame({'a': [-10., 10., 10.], 'b': [0., 0., 0.]})
+        predictions.upper_forecast = predictions.forecast + 1
+        predictions.lower_forecast = predictions.forecast - 1
+        actual = pd.DataFrame({'a': [-10., 10., 10.], 'b': [0., 10., 0.]})
+        predictions.evaluate(actual, per_timestamp_errors=True)
+        # later edits to the inputs must not change the result
+        actual.to_numpy(copy=False)[:] = predictions.forecast.to_numpy()
+        np.testing.assert_allclose(
+            predictions.per_timestamp.loc['weighted_smape'], [0., 100., 0.]
+        )
+
+    def test_downcast(self):
+        predictions = PredictionObject()
+        predictions.forecast = pd.DataFrame({'a': [0., 1., 2.], 'b': [1., 1., 1.]})
+        predictions.upper_forecast = predictions.forecast + 1
+        predictions.lower_forecast = predictions.forecast - 1
+        actual = pd.DataFrame({'a': [1., 1., 1.], 'b': [0., 3., 1.]})
+        expected = predictions.evaluate(actual).avg_metrics
+        self.assertIs(predictions.downcast(), predictions)
+        for df in [predictions.forecast, predictions.upper_forecast, predictions.lower_forecast]:
+            self.assertTrue((df.dtypes == np.float32).all())
+        result = predictions.evaluate(actual, per_timestamp_errors=True).avg_metrics
+        self.assertAlmostEqual(result['mae'], expected['mae'], places=5)
+        self.assertAlmostEqual(result['smape'], expected['smape'], places=3)
+
+    def test_series_weights_edited(self):
+        predictions = PredictionObject()
+        predictions.forecast = pd.DataFrame({'a': [0., 1., 2.], 'b': [1., 1., 1.]})
+        predictions.upper_forecast = predictions.forecast + 1
+        predictions.lower_forecast = predictions.forecast - 1
+        actual = pd.DataFrame({'a': [1., 1., 1.], 'b': [0., 3., 1.]})
+        weights = {'a': 1, 'b': 1}
+        predictions.evaluate(actual, series_weights=weights)
+        # editing the same dict in place must be picked up by the next evaluate
+        weights['a'] = 10
+        edited = predictions.evaluate(actual, series_weights=weights)
+        edited = edited.avg_metrics_weighted['mae']
+        fresh = predictions.evaluate(actual, series_weights={'a': 10, 'b': 1})
+        self.assertEqual(edited, fresh.avg_metrics_weighted['mae'])
+        self.assertAlmostEqual(edited, (10 * 2 / 3 + 1) / 11)
+
 
 class TestConstraint(unittest.TestCase):
 
+    def setUp(self):
+        index = pd.date_range("2022-01-01", periods=10, freq="D")
+        self.df_train = pd.DataFrame(
+            {"a": np.arange(10, dtype=float), "b": np.arange(10, 20, dtype=float)},
+            index=index,
+        )
+        forecast_index = pd.date_range("2022-01-11", periods=3, freq="D")
+        self.forecast = pd.DataFrame(
+            {"a": [-5.0, 4.0, 15.0], "b": [5.0, np.nan, 25.0]}, index=forecast_index
+        )
+
     def test_constraints(self):
         """This at least assures no changes in behavior go unnoticed, hopefully."""
         predictions = PredictionObject()
@@ -122,3 +205,123 @@ class TestConstraint(unittest.TestCase):
         # test upper constraint
         self.assertTrue(10.0 == predictions.forecast.max().sum())
         self.assertTrue((predictions.upper_forecast.round(2).max() == np.array([13.00, 8.87])).all())
+
+    def test_hard_constraint(self):
+        forecast, lower, upper = apply_constraints(
+            self.forecast.copy(),
+            self.forecast - 1,
+            self.forecast + 1,
+            constraint_method="quantile",
+            constraint_regularization=1,
+            upper_constraint=1.0,
+            lower_constraint=0.0,
+            bounds=True,
+            df_train=self.df_train,
+        )
+        expected = pd.DataFrame(
+            {"a": [0.0, 4.0, 9.0], "b": [10.0, np.nan, 19.0]},
+            index=self.forecast.index,
+        )
+        pd.testing.assert_frame_equal(forecast, expected)
+        self.assertGreaterEqual(lower.min().min(), 0.0)
+        self.assertLessEqual(upper["a"].max(), 9.0)
+
+    def test_soft_constraint(self):
+        forecast, _, _ = apply_constraints(
+            self.forecast.copy(),
+            None,
+            None,
+            constraint_method="absolute",
+            constraint_regularization=0.5,
+            upper_constraint=[10.0, 20.0],
+            lower_constraint=0.0,
+            bounds=False,
+        )
+        expected = pd.DataFrame(
+            {"a": [-2.5, 4.0, 12.5], "b": [5.0, np.nan, 22.5]},
+            index=self.forecast.index,
+        )
+        pd.testing.assert_frame_equal(forecast, expected)
+
+    def test_upper_only(self):
+        forecast, _, _ = apply_constraints(
+            self.forecast.copy(),
+            None,
+            None,
+            constraint_method="stdev_min",
+            constraint_regularization=1,
+            upper_constraint=0.0,
+            lower_constraint=None,
+            bounds=False,
+            df_train=self.df_train,
+        )
+        self.assertEqual(forecast["a"].min(), -5.0)
+        self.assertEqual(forecast["a"].max(), 9.0)
+        self.assertEqual(forecast["b"].max(), 19.0)
+
+    def test_thresholds_follow_df_train(self):
+        args = ("quantile", 1, 1.0, 0.0, False)
+        first, _, _ = apply_constraints(
+            self.forecast.copy(), None, None, *args, self.df_train
+        )
+        second, _, _ = apply_constraints(
+            self.forecast.copy(), None, None, *args, self.df_train
+        )
+        pd.testing.assert_frame_equal(first, second)
+        # a different training frame of the same shape gives new thresholds
+        shifted, _, _ = apply_constraints(
+            self.forecast.copy(), None, None, *args, self.df_train + 100
+        )
+        self.assertEqual(shifted["a"].min(), 100.0)
+        # nor the same training frame edited in place
+        self.df_train += 100
+        edited, _, _ = apply_constraints(
+            self.forecast.copy(), None, None, *args, self.df_train
+        )
+        self.assertEqual(edited["a"].min(), 100.0)
+
+    def test_int_constraint_dtype(self):
+        forecast = pd.DataFrame({"a": [-5, 4, 5], "b": [12, 13, 14]})
+        train = self.df_train.astype(int).reset_index(drop=True)
+        # nothing clipped, or clipped to whole numbers, keeps the int dtype
+        result, _, _ = apply_constraints(
+            forecast.copy(), None, None, "quantile", 1, 1.0, 0.0, False, train
+        )
+        self.assertEqual(result["a"].tolist(), [0, 4, 5])
+        self.assertTrue((result.dtypes == "int64").all())
+        # only the column clipped to a fraction becomes float
+        result, _, _ = apply_constraints(
+            forecast.copy(), None, None, "absolute", 1, [9.0, 19.0], 0.5, False
+        )
+        self.assertEqual(result["a"].tolist(), [0.5, 4.0, 5.0])
+        self.assertEqual(result.dtypes.tolist(), [np.float64, np.int64])
+
+    def test_no_op_constraint(self):
+        for method, regularization, upper, lower in [
+            ("quantile", 0, 1.0, 0.0),
+            ("quantile", 1, None, None),
+            (None, 1, 1.0, 0.0),
+        ]:
+            forecast, _, _ = apply_constraints(
+                self.forecast,
+                None,
+                None,
+                method,
+                regularization,
+                upper,
+                lower,
+                False,
+                None,
+            )
+            self.assertIs(forecast, self.forecast)
+
+    def test_soft_clip_numpy_fallback(self):
+        args = ("stdev", 0.3, 0.5, 0.5, True, self.df_train)
+        frames = (self.forecast, self.forecast - 8, self.forecast + 8)
+        # small inputs skip the kernels, force them to compare both paths
+        with mock.patch.object(base, "_numba_min_size", 0):
+            expected = apply_constraints(*[x.copy() for x in frames], *args)
+        with mock.patch.object(base, "numba_present", False):
+            result = apply_constraints(*[x.copy() for x in frames], *args)
+        for left, right in zip(expected, result):
+            pd.testing.assert_frame_equal(left, right)